@@ -0,0 +1,115 @@
+"""
+On-disk cache of answers.
+
+The key is a hash of the input file and of the sources of the solution module and of
+all repo modules it imports (transitively), so a change in e.g. `day_5/star_1/algo.py`
+invalidates `day_5/star_2_01_slow` but a change in another day doesn't. The least
+recently used entries are evicted above `max_entries`.
+"""
+import ast
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+ROOT_DIR = Path(__file__).parent.resolve()
+CACHE_DIR = ROOT_DIR / ".aoc_cache"
+MAX_ENTRIES = 1000
+
+
+def _resolve(root: Path, name: str) -> Path | None:
+    path = root.joinpath(*name.split("."))
+    for candidate in [path.with_suffix(".py"), path / "__init__.py"]:
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _get_imported_names(path: Path, root: Path) -> list[str]:
+    package = ".".join(path.relative_to(root).parent.parts)
+    names = []
+
+    for node in ast.walk(ast.parse(path.read_text())):
+        if isinstance(node, ast.Import):
+            names += [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            if node.level:
+                parts = package.split(".")
+                parts = parts[: len(parts) - node.level + 1]
+                base = ".".join(filter(None, [*parts, base]))
+            names.append(base)
+            # `from package import module`
+            names += [f"{base}.{alias.name}" for alias in node.names]
+    return names
+
+
+def get_source_files(path: Path, root: Path = ROOT_DIR) -> list[Path]:
+    """`path` and all modules from `root` it imports, transitively"""
+    found = {path}
+    stack = [path]
+    while stack:
+        for name in _get_imported_names(stack.pop(), root):
+            imported = _resolve(root, name)
+            if imported is not None and imported not in found:
+                found.add(imported)
+                stack.append(imported)
+    return sorted(found)
+
+
+def get_file_hash(path: Path) -> str:
+    file_hash = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(2**20), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def get_key(input_file: Path, module_file: Path, root: Path = ROOT_DIR) -> str:
+    key = hashlib.sha256(get_file_hash(input_file).encode())
+    for path in get_source_files(module_file, root):
+        key.update(path.relative_to(root).as_posix().encode())
+        key.update(get_file_hash(path).encode())
+    return key.hexdigest()
+
+
+@dataclass
+class AnswerCache:
+    directory: Path = CACHE_DIR
+    max_entries: int = MAX_ENTRIES
+
+    def _get_path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        path = self._get_path(key)
+        try:
+            answer = json.loads(path.read_text())["answer"]
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            return False, None
+        # mtime is the last use, see `evict`
+        os.utime(path)
+        return True, answer
+
+    def put(self, key: str, answer: Any, **info):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._get_path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps({"answer": answer, **info}, default=str))
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def evict(self):
+        entries = []
+        for path in self.directory.glob("*.json"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                # evicted by another process
+                continue
+
+        entries.sort()
+        for _, path in entries[: max(0, len(entries) - self.max_entries)]:
+            path.unlink(missing_ok=True)
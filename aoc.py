@@ -0,0 +1,452 @@
+"""
+Runner for all solutions in the repo.
+
+Every `year_*/day_*/star_*/algo.py` module that exposes `solve` can be run. If the
+module also has `parse`, the input text goes through `parse` first and its result is
+passed to `solve`, otherwise `solve` gets the raw text. Modules with
+`LINES_INPUT = True` get an iterator of lines (`commons.iter_lines`) instead, so the
+input is streamed and doesn't have to fit in memory, modules with `PATH_INPUT = True`
+get the path of the input file and read it themselves. Both phases are timed (wall
+and CPU time), RSS is reported after the run together with its peak during the run
+(`commons.PeakMemorySampler`).
+
+Answers are cached on disk (see `answer_cache`), a cached answer is returned without
+running the solution unless `--no-cache` is given.
+
+`--trace` saves the spans (`commons.span`) of the runs as Chrome trace JSON, the
+runner marks the parse and solve phases, solutions can mark their own phases.
+
+With `--jobs` every (solution, input) job runs in its own process, so independent
+puzzles use all cores and a crashing job doesn't take down the others.
+
+`--profile` runs every solution once more under `cProfile` (see `profiling`), saves
+its pstats and collapsed stacks for flame graphs and prints the hottest functions and
+the overhead of profiling compared to the normal run.
+
+`--import-times` shows how long importing every solution module takes in a fresh
+interpreter and which packages are the heaviest part of it.
+
+    python -m aoc --day 5 --star 2
+    python -m aoc --jobs 8
+    python -m aoc --import-times
+    python -m aoc --day 5 --star 2_03 --profile profiles
+"""
+import argparse
+import importlib
+import multiprocessing
+import os
+import re
+import subprocess
+import sys
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from multiprocessing.connection import Connection, wait
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+from answer_cache import AnswerCache, get_key
+from profiling import profile
+from commons import (
+    PeakMemorySampler,
+    get_memory_usage,
+    iter_lines,
+    save_chrome_trace,
+    span,
+    tracing,
+)
+
+ROOT_DIR = Path(__file__).parent.resolve()
+SOLUTION_PATH_RE = re.compile(r"year_(\d+)/day_(\d+)/star_(\w+)/algo\.py")
+
+
+@dataclass(frozen=True)
+class Solution:
+    year: int
+    day: int
+    star: str
+    path: Path
+
+    @property
+    def module_name(self) -> str:
+        return f"year_{self.year}.day_{self.day}.star_{self.star}.algo"
+
+    @property
+    def name(self) -> str:
+        return f"{self.year}/{self.day}/{self.star}"
+
+
+@dataclass
+class Result:
+    solution: Solution
+    input_file: Path | None = None
+    answer: Any = None
+    cached: bool = False
+    error: str | None = None
+    parse_time: float = 0.0
+    parse_cpu_time: float = 0.0
+    solve_time: float = 0.0
+    solve_cpu_time: float = 0.0
+    # in MiB
+    rss: int = 0
+    peak_rss: int = 0
+    trace_events: list[dict[str, Any]] = field(default_factory=list)
+    # top functions and overhead, see `_profile`
+    profile: str | None = None
+
+
+def discover(root: Path = ROOT_DIR) -> list[Solution]:
+    solutions = []
+    for path in root.glob("year_*/day_*/star_*/algo.py"):
+        match = SOLUTION_PATH_RE.fullmatch(path.relative_to(root).as_posix())
+        if match is None:
+            continue
+        year, day, star = match.groups()
+        solutions.append(Solution(int(year), int(day), star, path))
+
+    solutions.sort(key=lambda s: (s.year, s.day, s.star))
+    return solutions
+
+
+def select(
+    solutions: Iterable[Solution],
+    years: list[int] | None = None,
+    days: list[int] | None = None,
+    stars: list[str] | None = None,
+) -> list[Solution]:
+    """`stars` are prefixes, e.g. "2" matches "2_01_slow" and "2_03_ok" """
+    return [
+        s
+        for s in solutions
+        if (not years or s.year in years)
+        and (not days or s.day in days)
+        and (not stars or any(s.star.startswith(star) for star in stars))
+    ]
+
+
+def _timed(func: Callable, *args) -> tuple[Any, float, float]:
+    wall, cpu = time.perf_counter(), time.process_time()
+    value = func(*args)
+    return value, time.perf_counter() - wall, time.process_time() - cpu
+
+
+def parse_input(module, text: str) -> Any:
+    parse = getattr(module, "parse", None)
+    return parse(text) if parse else text
+
+
+def load_input(module, input_file: Path) -> Any:
+    if getattr(module, "PATH_INPUT", False):
+        return input_file
+    if getattr(module, "LINES_INPUT", False):
+        return iter_lines(input_file)
+    return parse_input(module, input_file.read_text())
+
+
+def _run(result: Result, input_file: Path | None, cache: AnswerCache | None):
+    solution = result.solution
+    module = importlib.import_module(solution.module_name)
+    if not hasattr(module, "solve"):
+        result.error = "no solve()"
+        return
+
+    input_file = result.input_file = input_file or module.input_data_file
+    if not input_file.exists():
+        result.error = f"missing {input_file}"
+        return
+
+    if cache is not None:
+        key = get_key(input_file, solution.path)
+        result.cached, result.answer = cache.get(key)
+        if result.cached:
+            return
+
+    with span(solution.name):
+        with span("parse"):
+            data, result.parse_time, result.parse_cpu_time = _timed(
+                load_input, module, input_file
+            )
+        with span("solve"):
+            result.answer, result.solve_time, result.solve_cpu_time = _timed(
+                module.solve, data
+            )
+
+    if cache is not None:
+        cache.put(key, result.answer, solution=solution.name)
+
+
+def _profile(result: Result, profile_dir: Path, top: int):
+    solution, input_file = result.solution, result.input_file
+    # fresh module, module level caches would make the second run faster
+    module = importlib.reload(importlib.import_module(solution.module_name))
+    profiled = profile(lambda: module.solve(load_input(module, input_file)))
+
+    name = solution.name.replace("/", "_")
+    if input_file != getattr(module, "input_data_file", None):
+        name = f"{name}_{input_file.stem}"
+    path = profile_dir / name
+    profiled.save(path)
+
+    overhead = profiled.wall_time / max(result.parse_time + result.solve_time, 1e-9)
+    result.profile = (
+        f"profile {path}.pstats {path}.folded  "
+        f"{profiled.wall_time:.4f}s, overhead x{overhead:.2f}\n"
+        f"{profiled.format_top(top)}"
+    )
+
+
+def run(
+    solution: Solution,
+    input_file: Path | None = None,
+    cache: AnswerCache | None = None,
+    trace: bool = False,
+    profile_dir: Path | None = None,
+    profile_top: int = 10,
+) -> Result:
+    """
+    With `trace` spans (see `commons.span`) of the run are in `trace_events`. With
+    `profile_dir` the solution runs once more under the profiler, after the measured
+    run, see `_profile`.
+    """
+    result = Result(solution)
+
+    with PeakMemorySampler() as sampler:
+        with tracing(sampler=sampler) if trace else nullcontext() as tracer:
+            try:
+                _run(result, input_file, cache)
+            except Exception as e:
+                result.error = f"{type(e).__name__}: {e}"
+
+    if tracer is not None:
+        result.trace_events = tracer.to_chrome_trace()
+    result.rss = get_memory_usage()
+    result.peak_rss = round(sampler.peak / 1024**2)
+
+    if profile_dir is not None and result.error is None and not result.cached:
+        try:
+            _profile(result, profile_dir, profile_top)
+        except Exception as e:
+            result.error = f"profile {type(e).__name__}: {e}"
+    return result
+
+
+@dataclass
+class ImportTime:
+    module: str
+    # in µs
+    self_time: int
+    cumulative_time: int
+    # 0 - imported by `import` in `-c`, 1 - imported by that module, ...
+    depth: int
+
+
+def get_import_times(module_name: str) -> list[ImportTime]:
+    """`python -X importtime` of `module_name` in a fresh interpreter"""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times = []
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_time, cumulative_time, module = line.removeprefix("import time:").split(
+            "|"
+        )
+        depth = (len(module) - len(module.lstrip()) - 1) // 2
+        times.append(
+            ImportTime(module.strip(), int(self_time), int(cumulative_time), depth)
+        )
+    return times
+
+
+def format_import_times(
+    solution: Solution, times: list[ImportTime], top: int = 3
+) -> str:
+    """total import time and the heaviest modules imported by the solution itself"""
+    index, module = next(
+        (i, t) for i, t in enumerate(times) if t.module == solution.module_name
+    )
+    # a module's imports are the lines right before it that are nested deeper
+    start = index
+    while start > 0 and times[start - 1].depth > module.depth:
+        start -= 1
+    imported = [t for t in times[start:index] if t.depth == module.depth + 1]
+
+    heaviest = sorted(imported, key=lambda t: t.cumulative_time, reverse=True)[:top]
+    return f"{solution.name:<28} import {module.cumulative_time / 1000:9.1f}ms  " + (
+        ", ".join(f"{t.module} {t.cumulative_time / 1000:.1f}ms" for t in heaviest)
+    )
+
+
+Job = tuple[Solution, Path | None]
+
+
+def _run_job(connection: Connection, job: Job, kwargs: dict[str, Any]):
+    connection.send(run(*job, **kwargs))
+    connection.close()
+
+
+def run_parallel(
+    jobs: list[Job], processes: int | None = None, **kwargs
+) -> Iterator[Result]:
+    """
+    Every job runs in a new process, at most `processes` at once. Results are yielded
+    in the order of `jobs`, a job whose process dies gets a result with an error.
+    `kwargs` are passed to `run`.
+    """
+    processes = processes or os.cpu_count() or 1
+    pending = iter(enumerate(jobs))
+    running: dict[Connection, tuple[int, multiprocessing.Process, Job]] = {}
+    done: dict[int, Result] = {}
+    next_index = 0
+
+    while True:
+        while len(running) < processes:
+            item = next(pending, None)
+            if item is None:
+                break
+            index, job = item
+
+            receiver, sender = multiprocessing.Pipe(duplex=False)
+            process = multiprocessing.Process(
+                target=_run_job, args=(sender, job, kwargs), daemon=True
+            )
+            process.start()
+            sender.close()
+            running[receiver] = (index, process, job)
+
+        if not running:
+            break
+
+        for receiver in wait(list(running)):
+            index, process, (solution, input_file) = running.pop(receiver)
+            try:
+                done[index] = receiver.recv()
+            except EOFError:
+                process.join()
+                done[index] = Result(
+                    solution,
+                    input_file,
+                    error=f"process died, exit code {process.exitcode}",
+                )
+            receiver.close()
+            process.join()
+
+        while next_index in done:
+            yield done.pop(next_index)
+            next_index += 1
+
+
+def format_result(result: Result, show_input: bool = False) -> str:
+    line = f"{result.solution.name:<28}"
+    if show_input:
+        line = f"{line} {str(result.input_file):<20}"
+    if result.error is not None:
+        return f"{line} {result.error}"
+    if result.cached:
+        return f"{line} {str(result.answer):>16}  cached"
+    return (
+        f"{line} {str(result.answer):>16}"
+        f"  parse {result.parse_time:9.4f}s (cpu {result.parse_cpu_time:9.4f}s)"
+        f"  solve {result.solve_time:9.4f}s (cpu {result.solve_cpu_time:9.4f}s)"
+        f"  rss {result.rss:6}MiB  peak {result.peak_rss:6}MiB"
+    )
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="aoc", description="Run solutions.")
+    parser.add_argument("-y", "--year", type=int, nargs="+", action="extend")
+    parser.add_argument("-d", "--day", type=int, nargs="+", action="extend")
+    parser.add_argument("-s", "--star", nargs="+", action="extend")
+    parser.add_argument(
+        "-i",
+        "--input",
+        type=Path,
+        nargs="+",
+        action="extend",
+        help="input files used instead of input.txt",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of processes, 0 - number of CPUs",
+    )
+    parser.add_argument(
+        "--import-times",
+        action="store_true",
+        help="only report how long importing the solutions takes",
+    )
+    parser.add_argument(
+        "--trace",
+        type=Path,
+        help="save spans of the runs as Chrome trace JSON, implies --no-cache",
+    )
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        metavar="DIR",
+        help="profile the runs, save pstats and collapsed stacks, implies --no-cache",
+    )
+    parser.add_argument(
+        "--top", type=int, default=10, help="number of functions shown by --profile"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="always run, don't use cached answers"
+    )
+    parser.add_argument(
+        "-l", "--list", action="store_true", help="only list matching solutions"
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None):
+    args = get_parser().parse_args(argv)
+    solutions = select(discover(), args.year, args.day, args.star)
+
+    if args.list:
+        for solution in solutions:
+            print(solution.name)
+        return
+
+    if args.import_times:
+        for solution in solutions:
+            times = get_import_times(solution.module_name)
+            print(format_import_times(solution, times))
+        return
+
+    jobs = [(s, input_file) for s in solutions for input_file in args.input or [None]]
+    cache = None if args.no_cache or args.trace or args.profile else AnswerCache()
+    kwargs = {
+        "cache": cache,
+        "trace": args.trace is not None,
+        "profile_dir": args.profile,
+        "profile_top": args.top,
+    }
+    trace_events = []
+    start = time.perf_counter()
+
+    if args.jobs == 1:
+        results = (run(*job, **kwargs) for job in jobs)
+    else:
+        results = run_parallel(jobs, args.jobs or None, **kwargs)
+    for result in results:
+        print(format_result(result, show_input=bool(args.input)))
+        if result.profile is not None:
+            print(result.profile)
+        trace_events += result.trace_events
+
+    if args.trace:
+        save_chrome_trace(args.trace, trace_events)
+
+    print(f"total: {time.perf_counter() - start:.4f}s")
+
+
+if __name__ == "__main__":
+    main()
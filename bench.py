@@ -0,0 +1,240 @@
+"""
+Benchmark of alternative solutions (variants) of the same star, e.g. `day_5/star_2_01_slow`,
+`star_2_02_cache_slower` and `star_2_03_ok`, on generated inputs of growing size.
+
+Inputs come from `year_*/day_*/generate.py` (see `generate`), by default of its
+`SIZES`. For every size each variant is timed (best of `--repeat`) and its peak
+traced memory is measured in a separate run, with `processes=1` for variants with a
+process pool. Results are saved as JSON, so runs can be
+compared with `--compare`.
+
+    python -m bench --day 5 --star 2 --output day_5.json
+    python -m bench --day 5 --star 2 --compare day_5.json
+"""
+import argparse
+import contextlib
+import importlib
+import inspect
+import json
+import os
+import platform
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from aoc import Solution, discover, load_input, parse_input, select
+from generate import generate, get_generator
+
+
+def get_group_name(solution: Solution) -> str:
+    return f"{solution.year}/{solution.day}/{solution.star.split('_')[0]}"
+
+
+def get_groups(solutions: list[Solution]) -> dict[str, list[Solution]]:
+    groups: dict[str, list[Solution]] = {}
+    for solution in solutions:
+        groups.setdefault(get_group_name(solution), []).append(solution)
+    return groups
+
+
+def _load(solution: Solution) -> Any:
+    # fresh module every run, module level state (like `CACHE` in
+    # `star_2_02_cache_slower`) must not leak between runs and inputs
+    module = importlib.reload(importlib.import_module(solution.module_name))
+    if not hasattr(module, "solve"):
+        raise AttributeError("no solve()")
+    return module
+
+
+def _run(module: Any, text: str, input_file: Path | None = None, **kwargs) -> Any:
+    if getattr(module, "PATH_INPUT", False) or getattr(module, "LINES_INPUT", False):
+        # the path or the stream of lines, as `aoc` gives them
+        data = load_input(module, input_file)
+    else:
+        data = parse_input(module, text)
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        return module.solve(data, **kwargs)
+
+
+def measure(
+    solution: Solution, text: str, repeat: int = 1, input_file: Path | None = None
+) -> dict[str, Any]:
+    """
+    `input_file` with `text`, for solutions with `PATH_INPUT` or `LINES_INPUT`. Loading
+    the input and solving are measured, reloading the module is not.
+
+    tracemalloc traces only this process, so the memory of a solution with a process
+    pool (a `processes` argument) is measured with `processes=1`, its chunks are then
+    scanned in this process.
+    """
+    times = []
+    for _ in range(repeat):
+        module = _load(solution)
+        start = time.perf_counter()
+        answer = _run(module, text, input_file)
+        times.append(time.perf_counter() - start)
+
+    module = _load(solution)
+    kwargs = {}
+    if "processes" in inspect.signature(module.solve).parameters:
+        kwargs["processes"] = 1
+    tracemalloc.start()
+    try:
+        _run(module, text, input_file, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "time": min(times),
+        # in MiB
+        "peak_memory": round(peak / 1024**2, 3),
+        # processes of the memory run, if not the default one
+        **({"memory_processes": kwargs["processes"]} if kwargs else {}),
+        "answer": answer,
+    }
+
+
+def bench_group(
+    solutions: list[Solution],
+    sizes: list[int] | None = None,
+    seed: int = 0,
+    repeat: int = 1,
+    max_time: float | None = None,
+) -> dict[str, Any]:
+    """
+    Variant that fails or takes longer than `max_time` is not run for bigger sizes.
+    """
+    generator = get_generator(solutions[0].year, solutions[0].day)
+    sizes = sizes or generator.SIZES
+    variants: dict[str, list[dict[str, Any]]] = {s.star: [] for s in solutions}
+    finished: set[str] = set()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size in sizes:
+            text = generate(generator, size, seed)
+            input_file = Path(tmp_dir) / "input.txt"
+            input_file.write_text(text)
+            answers = set()
+
+            for solution in solutions:
+                if solution.star in finished:
+                    continue
+                try:
+                    measurement = {
+                        "size": size,
+                        **measure(solution, text, repeat, input_file),
+                    }
+                except Exception as e:
+                    measurement = {"size": size, "error": f"{type(e).__name__}: {e}"}
+                    finished.add(solution.star)
+                else:
+                    answers.add(str(measurement["answer"]))
+                    if max_time is not None and measurement["time"] > max_time:
+                        finished.add(solution.star)
+
+                variants[solution.star].append(measurement)
+                print(format_measurement(solution, measurement))
+
+            if len(answers) > 1:
+                print(f"  different answers for size={size}: {sorted(answers)}")
+
+    return {"sizes": sizes, "variants": variants}
+
+
+def bench(
+    solutions: list[Solution],
+    sizes: list[int] | None = None,
+    seed: int = 0,
+    repeat: int = 1,
+    max_time: float | None = None,
+) -> dict[str, Any]:
+    groups = {}
+    for name, group in get_groups(solutions).items():
+        if get_generator(group[0].year, group[0].day) is None:
+            print(f"{name}: no generate.py, skipped")
+            continue
+        groups[name] = bench_group(group, sizes, seed, repeat, max_time)
+
+    return {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "seed": seed,
+        "repeat": repeat,
+        "groups": groups,
+    }
+
+
+def format_measurement(solution: Solution, measurement: dict[str, Any]) -> str:
+    line = f"{solution.name:<28} size={measurement['size']:<10}"
+    if "error" in measurement:
+        return f"{line} {measurement['error']}"
+    memory_processes = ""
+    if "memory_processes" in measurement:
+        memory_processes = f" (processes={measurement['memory_processes']})"
+    return (
+        f"{line} {measurement['time']:10.4f}s {measurement['peak_memory']:10.3f}MiB"
+        f"{memory_processes}  answer={measurement['answer']}"
+    )
+
+
+def compare(old: dict[str, Any], new: dict[str, Any]) -> list[str]:
+    """time and memory ratios new / old for every variant and size present in both"""
+    lines = []
+    for name, group in new["groups"].items():
+        old_variants = old["groups"].get(name, {}).get("variants", {})
+
+        for star, measurements in group["variants"].items():
+            old_measurements = {
+                m["size"]: m for m in old_variants.get(star, []) if "time" in m
+            }
+            for measurement in measurements:
+                old_measurement = old_measurements.get(measurement["size"])
+                if old_measurement is None or "time" not in measurement:
+                    continue
+                time_ratio = measurement["time"] / max(old_measurement["time"], 1e-9)
+                memory_ratio = measurement["peak_memory"] / max(
+                    old_measurement["peak_memory"], 1e-9
+                )
+                lines.append(
+                    f"{name.rsplit('/', 1)[0] + '/' + star:<28} "
+                    f"size={measurement['size']:<10} "
+                    f"time x{time_ratio:.2f}  memory x{memory_ratio:.2f}"
+                )
+    return lines
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="bench", description="Compare variants.")
+    parser.add_argument("-y", "--year", type=int, nargs="+", action="extend")
+    parser.add_argument("-d", "--day", type=int, nargs="+", action="extend")
+    parser.add_argument("-s", "--star", nargs="+", action="extend")
+    parser.add_argument("--sizes", type=int, nargs="+", help="default generate.SIZES")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument(
+        "--max-time", type=float, help="stop growing size of a slower variant"
+    )
+    parser.add_argument("-o", "--output", type=Path, help="save results as JSON")
+    parser.add_argument("-c", "--compare", type=Path, help="JSON of a previous run")
+    return parser
+
+
+def main(argv: list[str] | None = None):
+    args = get_parser().parse_args(argv)
+    solutions = select(discover(), args.year, args.day, args.star)
+
+    result = bench(solutions, args.sizes, args.seed, args.repeat, args.max_time)
+
+    if args.output:
+        args.output.write_text(json.dumps(result, indent=2, default=str))
+    if args.compare:
+        for line in compare(json.loads(args.compare.read_text()), result):
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
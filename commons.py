@@ -1,8 +1,348 @@
+import json
+import mmap
+import multiprocessing
 import os
+import resource
+import sys
+import threading
+import time
+from contextlib import ContextDecorator, contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterator, TypeVar
 
-import psutil
+if TYPE_CHECKING:
+    import numpy as np
+
+PAGE_SIZE = resource.getpagesize()
+
+T = TypeVar("T")
 
 
 def get_memory_usage() -> int:
     """in MiB"""
+    import psutil
+
     return round(psutil.Process(os.getpid()).memory_info().rss / 1024**2)
+
+
+def iter_lines(path: Path, chunk_size: int = 2**20) -> Iterator[str]:
+    """
+    Lines of the file without line endings. The file is memory-mapped and decoded
+    chunk by chunk, memory doesn't grow with the size of the file.
+    """
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start, size = 0, len(mm)
+            released = 0
+            while start < size:
+                end = mm.rfind(b"\n", start, start + chunk_size) + 1
+                if end <= start:
+                    # a line longer than `chunk_size`
+                    end = mm.find(b"\n", start + chunk_size) + 1 or size
+                yield from mm[start:end].decode().splitlines()
+                start = end
+
+                # read pages would count to RSS until the end of the file
+                if hasattr(mmap, "MADV_DONTNEED"):
+                    page_end = end - end % mmap.PAGESIZE
+                    if page_end > released:
+                        mm.madvise(mmap.MADV_DONTNEED, released, page_end - released)
+                        released = page_end
+
+
+@contextmanager
+def map_input(path: Path) -> Iterator[memoryview]:
+    """read-only view of the bytes of the memory-mapped file"""
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield memoryview(b"")
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                yield view
+            finally:
+                view.release()
+
+
+def get_chunks(
+    data: bytes | mmap.mmap, chunk_size: int = 2**24
+) -> Iterator[tuple[int, int]]:
+    """(start, end) of chunks of about `chunk_size` bytes, ending after a newline"""
+    start, size = 0, len(data)
+    while start < size:
+        end = data.find(b"\n", min(start + chunk_size, size) - 1) + 1 or size
+        yield start, end
+        start = end
+
+
+def map_chunks(
+    worker: Callable[[tuple], T],
+    path: Path,
+    args: tuple = (),
+    processes: int | None = None,
+    chunk_size: int = 2**24,
+) -> list[T]:
+    """
+    Results of `worker((path, start, end, *args))` for the chunks of the file (see
+    `get_chunks`), in any order, from a process pool of `processes` (all CPUs by
+    default). `worker` is pickled, so it's a function of a module. Inside a daemon
+    process (e.g. `aoc --jobs`), which can't have children, the chunks are done in the
+    process itself.
+    """
+    processes = processes or os.cpu_count() or 1
+
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            tasks = [(path, *chunk, *args) for chunk in get_chunks(mm, chunk_size)]
+
+    if processes == 1 or len(tasks) == 1 or multiprocessing.current_process().daemon:
+        return list(map(worker, tasks))
+    with multiprocessing.Pool(min(processes, len(tasks))) as pool:
+        return list(pool.imap_unordered(worker, tasks))
+
+
+def get_run_values(
+    chars: "np.ndarray", starts: "np.ndarray", lengths: "np.ndarray"
+) -> "np.ndarray":
+    """
+    values of the runs of `lengths` ASCII digits at `starts` of the `uint8` array
+    `chars`, computed digit position by digit position for all runs at once
+    """
+    import numpy as np
+
+    values = np.zeros(len(starts), dtype=np.int64)
+    for position in range(int(lengths.max(initial=0))):
+        digits = chars[np.minimum(starts + position, len(chars) - 1)] - ord("0")
+        values = np.where(lengths > position, values * 10 + digits, values)
+    return values
+
+
+def get_peak_memory_usage() -> int:
+    """in MiB, peak RSS of the current process so far"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # linux reports KiB, macos reports bytes
+    return round(peak / (1024**2 if sys.platform == "darwin" else 1024))
+
+
+class RssReader:
+    """current RSS in bytes, reading /proc is a lot faster than psutil"""
+
+    def __init__(self):
+        self._statm: int | None = None
+        self._process = None
+        try:
+            self._statm = os.open("/proc/self/statm", os.O_RDONLY)
+        except OSError:
+            import psutil
+
+            self._process = psutil.Process()
+
+    def read(self) -> int:
+        if self._statm is not None:
+            return int(os.pread(self._statm, 64, 0).split()[1]) * PAGE_SIZE
+        return self._process.memory_info().rss
+
+    def close(self):
+        if self._statm is not None:
+            os.close(self._statm)
+            self._statm = None
+
+
+class PeakMemorySampler:
+    """
+    Thread reading RSS every `interval` seconds, `peak` is the highest RSS (in bytes)
+    seen since `start`. `watch` / `unwatch` give the peak of a part of the run.
+
+        with PeakMemorySampler() as sampler:
+            ...
+        print(sampler.peak)
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.peak = 0
+        self._rss = RssReader()
+        self._watches: list[list[int]] = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def sample(self) -> int:
+        rss = self._rss.read()
+        self.peak = max(self.peak, rss)
+        for watch in self._watches[:]:
+            watch[0] = max(watch[0], rss)
+        return rss
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def start(self) -> "PeakMemorySampler":
+        self.sample()
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        self.sample()
+        self._rss.close()
+
+    def __enter__(self) -> "PeakMemorySampler":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def watch(self) -> list[int]:
+        watch = [self.sample()]
+        self._watches.append(watch)
+        return watch
+
+    def unwatch(self, watch: list[int]) -> int:
+        """peak RSS since `watch()`"""
+        self.sample()
+        # by identity, watches with the same value are equal
+        self._watches = [w for w in self._watches if w is not watch]
+        return watch[0]
+
+
+@dataclass
+class Span:
+    name: str
+    # perf_counter_ns
+    start: int
+    duration: int
+    # in bytes
+    rss_change: int
+    peak_rss: int
+    depth: int
+    thread_id: int
+
+
+class Tracer:
+    """
+    Records spans, with `memory` also RSS change and peak RSS of every span, read by
+    `sampler` (a new one is started when not given).
+    """
+
+    def __init__(self, memory: bool = True, sampler: PeakMemorySampler | None = None):
+        self.spans: list[Span] = []
+        self._local = threading.local()
+        self._own_sampler = memory and sampler is None
+        self.sampler = PeakMemorySampler().start() if self._own_sampler else sampler
+
+    def close(self):
+        if self._own_sampler:
+            self.sampler.stop()
+
+    def _get_stack(self) -> list[tuple[int, int, list[int] | None]]:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def enter(self):
+        watch = self.sampler.watch() if self.sampler else None
+        rss = watch[0] if watch else 0
+        self._get_stack().append((time.perf_counter_ns(), rss, watch))
+
+    def exit(self, name: str):
+        end = time.perf_counter_ns()
+        stack = self._get_stack()
+        start, rss, watch = stack.pop()
+
+        rss_change = peak_rss = 0
+        if watch is not None:
+            peak_rss = self.sampler.unwatch(watch)
+            rss_change = self.sampler.sample() - rss
+        self.spans.append(
+            Span(
+                name,
+                start,
+                end - start,
+                rss_change,
+                peak_rss,
+                len(stack),
+                threading.get_ident(),
+            )
+        )
+
+    def to_chrome_trace(self) -> list[dict[str, Any]]:
+        """trace events, `chrome://tracing` or https://ui.perfetto.dev can show them"""
+        pid = os.getpid()
+        return [
+            {
+                "name": span.name,
+                "ph": "X",
+                "ts": span.start / 1000,
+                "dur": span.duration / 1000,
+                "pid": pid,
+                "tid": span.thread_id,
+                "args": {
+                    "rss_change_mib": round(span.rss_change / 1024**2, 3),
+                    "peak_rss_mib": round(span.peak_rss / 1024**2, 3),
+                },
+            }
+            for span in self.spans
+        ]
+
+
+_tracer: Tracer | None = None
+
+
+class span(ContextDecorator):
+    """
+    Marks a phase of a solution, does nothing unless inside `tracing()`.
+
+        with span("parse"):
+            ...
+
+        @span("flood fill")
+        def fill(...):
+            ...
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._tracer: Tracer | None = None
+
+    def _recreate_cm(self):
+        # a new span for every call of a decorated function, recursion and threads
+        # don't share `_tracer`
+        return span(self.name)
+
+    def __enter__(self):
+        # `tracing()` may end inside the span, so the tracer is remembered
+        self._tracer = _tracer
+        if self._tracer is not None:
+            self._tracer.enter()
+        return self
+
+    def __exit__(self, *exc):
+        if self._tracer is not None:
+            self._tracer.exit(self.name)
+        return False
+
+
+@contextmanager
+def tracing(
+    memory: bool = True, sampler: PeakMemorySampler | None = None
+) -> Iterator[Tracer]:
+    global _tracer
+    previous = _tracer
+    _tracer = tracer = Tracer(memory, sampler)
+    try:
+        yield tracer
+    finally:
+        _tracer = previous
+        tracer.close()
+
+
+def save_chrome_trace(path: Path, events: list[dict[str, Any]]):
+    path.write_text(json.dumps({"traceEvents": events}))
@@ -0,0 +1,16 @@
+import importlib
+import sys
+
+import pytest
+
+from aoc import discover
+
+
+@pytest.fixture
+def fresh_modules():
+    """reloads solutions after the test, so module state (e.g. caches) doesn't leak"""
+    yield
+    for solution in discover():
+        module = sys.modules.get(solution.module_name)
+        if module is not None:
+            importlib.reload(module)
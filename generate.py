@@ -0,0 +1,58 @@
+"""
+Seeded generators of big inputs, one `year_*/day_*/generate.py` per day with:
+
+    generate_lines(size, seed) - iterator of input lines
+    SIZES - default sizes of the benchmark
+    SCALE - default size here, the scale we want to stress-test
+
+    python -m generate --day 3 --size 10000 --output day_3.txt
+"""
+import argparse
+import importlib
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+
+def get_generator(year: int, day: int) -> ModuleType | None:
+    name = f"year_{year}.day_{day}.generate"
+    if importlib.util.find_spec(name) is None:
+        return None
+    return importlib.import_module(name)
+
+
+def generate(generator: ModuleType, size: int, seed: int = 0) -> str:
+    return "".join(generator.generate_lines(size, seed))
+
+
+def write(generator: ModuleType, path: Path, size: int, seed: int = 0):
+    with path.open("w") as f:
+        f.writelines(generator.generate_lines(size, seed))
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="generate", description="Generate input.")
+    parser.add_argument("-y", "--year", type=int, default=2023)
+    parser.add_argument("-d", "--day", type=int, required=True)
+    parser.add_argument("--size", type=int, help="default generate.SCALE of the day")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", type=Path, help="default stdout")
+    return parser
+
+
+def main(argv: list[str] | None = None):
+    args = get_parser().parse_args(argv)
+    generator = get_generator(args.year, args.day)
+    if generator is None:
+        raise SystemExit(f"no generator for year {args.year} day {args.day}")
+
+    size = args.size or generator.SCALE
+    if args.output:
+        write(generator, args.output, size, args.seed)
+    else:
+        sys.stdout.writelines(generator.generate_lines(size, args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Profiling of a single call.
+
+`cProfile` gives exact call counts and times (saved as pstats), a sampling thread
+records whole stacks of the profiled thread every `interval` seconds and saves them in
+the collapsed format ("a;b;c 12" per line) that flame graph tools read, e.g.
+`flamegraph.pl`, speedscope or https://www.speedscope.app.
+"""
+import cProfile
+import io
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import FrameType
+from typing import Any, Callable
+
+
+def _get_frame_name(frame: FrameType) -> str:
+    return f"{Path(frame.f_code.co_filename).stem}:{frame.f_code.co_name}"
+
+
+class StackSampler:
+    def __init__(self, thread_id: int, interval: float = 0.001):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _sample(self):
+        frame = sys._current_frames().get(self.thread_id)
+        names = []
+        while frame is not None:
+            names.append(_get_frame_name(frame))
+            frame = frame.f_back
+        if names:
+            self.stacks[";".join(reversed(names))] += 1
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self) -> "StackSampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+@dataclass
+class Profile:
+    value: Any
+    wall_time: float
+    stats: pstats.Stats
+    stacks: Counter[str] = field(default_factory=Counter)
+
+    def save(self, path: Path):
+        """`path` with .pstats and .folded suffixes"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.stats.dump_stats(path.with_suffix(".pstats"))
+        path.with_suffix(".folded").write_text(
+            "".join(f"{stack} {count}\n" for stack, count in self.stacks.items())
+        )
+
+    def format_top(self, top: int = 10) -> str:
+        """the `top` functions by their own time"""
+        stream = io.StringIO()
+        self.stats.stream = stream
+        self.stats.sort_stats(pstats.SortKey.TIME).print_stats(top)
+        # skip the header of print_stats
+        lines = stream.getvalue().splitlines()
+        start = next(i for i, line in enumerate(lines) if "ncalls" in line)
+        return "\n".join(line for line in lines[start:] if line.strip())
+
+
+def profile(func: Callable, *args, interval: float = 0.001) -> Profile:
+    profiler = cProfile.Profile()
+
+    with StackSampler(threading.get_ident(), interval) as sampler:
+        start = time.perf_counter()
+        profiler.enable()
+        try:
+            value = func(*args)
+        finally:
+            profiler.disable()
+        wall_time = time.perf_counter() - start
+
+    return Profile(value, wall_time, pstats.Stats(profiler), sampler.stacks)
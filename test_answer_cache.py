@@ -0,0 +1,72 @@
+import os
+
+from aoc import discover, run, select
+from answer_cache import AnswerCache, get_key, get_source_files
+
+
+def test_get_source_files(tmp_path):
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "__init__.py").write_text("")
+    (tmp_path / "pkg" / "base.py").write_text("import os\nfrom common import x\n")
+    (tmp_path / "pkg" / "other.py").write_text("")
+    (tmp_path / "common.py").write_text("x = 1\n")
+    (tmp_path / "pkg" / "main.py").write_text(
+        "from pkg.base import y\nfrom . import other\n"
+    )
+
+    files = get_source_files(tmp_path / "pkg" / "main.py", tmp_path)
+
+    assert [f.relative_to(tmp_path).as_posix() for f in files] == [
+        "common.py",
+        "pkg/__init__.py",
+        "pkg/base.py",
+        "pkg/main.py",
+        "pkg/other.py",
+    ]
+
+
+def test_get_key(tmp_path):
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("1abc2\n")
+    module_file = tmp_path / "algo.py"
+    module_file.write_text("import base\n")
+    base_file = tmp_path / "base.py"
+    base_file.write_text("")
+
+    key = get_key(input_file, module_file, tmp_path)
+    assert key == get_key(input_file, module_file, tmp_path)
+
+    base_file.write_text("# changed")
+    assert key != get_key(input_file, module_file, tmp_path)
+    key = get_key(input_file, module_file, tmp_path)
+
+    input_file.write_text("1abc3\n")
+    assert key != get_key(input_file, module_file, tmp_path)
+
+
+def test_answer_cache_eviction(tmp_path):
+    cache = AnswerCache(tmp_path, max_entries=2)
+
+    cache.put("a", 1)
+    cache.put("b", 2)
+    os.utime(tmp_path / "a.json", (0, 0))
+    os.utime(tmp_path / "b.json", (1, 1))
+    assert cache.get("a") == (True, 1)  # used, "b" is the oldest now
+    cache.put("c", 3)
+
+    assert cache.get("a") == (True, 1)
+    assert cache.get("b") == (False, None)
+    assert cache.get("c") == (True, 3)
+
+
+def test_run_cached(tmp_path):
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("1abc2\npqr3stu8vwx\n")
+    solution = select(discover(), days=[1], stars=["1"])[0]
+    cache = AnswerCache(tmp_path / "cache")
+
+    first = run(solution, input_file, cache)
+    second = run(solution, input_file, cache)
+
+    assert (first.answer, first.cached) == (50, False)
+    assert (second.answer, second.cached) == (50, True)
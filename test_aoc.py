@@ -0,0 +1,151 @@
+import multiprocessing
+import os
+import subprocess
+import sys
+from textwrap import dedent
+
+import pytest
+
+import aoc
+from aoc import (
+    ImportTime,
+    Result,
+    discover,
+    format_import_times,
+    get_import_times,
+    run,
+    select,
+)
+
+HEAVY_PACKAGES = {"tqdm", "pygame", "PIL", "psutil", "numpy"}
+
+
+def test_discover_and_select():
+    solutions = discover()
+    names = [s.name for s in solutions]
+
+    assert "2023/1/1" in names
+    assert "2023/5/2_03_ok" in names
+    assert [s.name for s in select(solutions, days=[5], stars=["2"])] == [
+        "2023/5/2_01_slow",
+        "2023/5/2_02_cache_slower",
+        "2023/5/2_03_ok",
+    ]
+
+
+def test_run(tmp_path):
+    input_file = tmp_path / "input.txt"
+    input_file.write_text(
+        dedent(
+            """\
+            1abc2
+            pqr3stu8vwx
+            a1b2c3d4e5f
+            treb7uchet
+            """
+        )
+    )
+    solution = select(discover(), days=[1], stars=["1"])[0]
+
+    result = run(solution, input_file)
+
+    assert result.error is None
+    assert result.answer == 142
+    assert result.parse_time >= 0 and result.solve_time >= 0
+    assert result.peak_rss > 0
+
+
+def test_run_missing_input(tmp_path):
+    solution = select(discover(), days=[1], stars=["1"])[0]
+
+    result = run(solution, tmp_path / "input.txt")
+
+    assert result.error.startswith("missing")
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="needs fork"
+)
+def test_run_parallel(monkeypatch):
+    def _run(solution, input_file=None, **kwargs):
+        if solution.day == 2:
+            os._exit(3)
+        return Result(solution, input_file, answer=solution.day)
+
+    monkeypatch.setattr(aoc, "run", _run)
+    # only a forked child has the patched `run`, with spawn it imports `aoc` again
+    monkeypatch.setattr(aoc, "multiprocessing", multiprocessing.get_context("fork"))
+    # without variants like "1_01_parallel"
+    solutions = [s for s in select(discover(), days=[1, 2, 3, 4]) if "_" not in s.star]
+
+    results = list(aoc.run_parallel([(s, None) for s in solutions], processes=3))
+
+    assert [r.solution for r in results] == solutions
+    assert [r.answer for r in results] == [1, 1, None, None, 3, 3, 4, 4]
+    assert results[2].error == "process died, exit code 3"
+
+
+def test_solutions_import_lightly():
+    modules = ", ".join(s.module_name for s in discover())
+    process = subprocess.run(
+        [sys.executable, "-c", f"import sys, {modules}; print(*sys.modules)"],
+        cwd=aoc.ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert not HEAVY_PACKAGES & set(process.stdout.split())
+
+
+def test_import_times():
+    (solution,) = select(discover(), days=[5], stars=["2_01"])
+
+    times = get_import_times(solution.module_name)
+
+    report = format_import_times(solution, times)
+    assert "year_2023.day_5.star_1.algo" in report
+    # imported by `site`, not by the solution
+    assert "encodings" not in report
+
+
+def test_format_import_times():
+    (solution,) = select(discover(), days=[5], stars=["2_01"])
+    times = [
+        ImportTime("certifi", 900, 900, 1),
+        ImportTime("site", 100, 1000, 0),
+        ImportTime("commons.helper", 50, 50, 2),
+        ImportTime("commons", 100, 150, 1),
+        ImportTime("pathlib", 30, 30, 1),
+        ImportTime(solution.module_name, 20, 200, 0),
+        ImportTime("json", 40, 40, 0),
+    ]
+
+    assert format_import_times(solution, times).split("  ")[-1] == (
+        "commons 0.1ms, pathlib 0.0ms"
+    )
+
+
+def test_run_trace(tmp_path):
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("1abc2\n")
+    solution = select(discover(), days=[1], stars=["1"])[0]
+
+    result = run(solution, input_file, trace=True)
+
+    assert [e["name"] for e in result.trace_events] == ["parse", "solve", "2023/1/1"]
+
+
+def test_run_profile(tmp_path):
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("1abc2\n" * 1000)
+    solution = select(discover(), days=[1], stars=["1"])[0]
+
+    result = run(solution, input_file, profile_dir=tmp_path / "profiles")
+
+    assert result.error is None
+    assert result.answer == 12000
+    assert "overhead x" in result.profile
+    assert "algo.py" in result.profile
+    assert (tmp_path / "profiles" / "2023_1_1_input.pstats").exists()
+    assert (tmp_path / "profiles" / "2023_1_1_input.folded").exists()
@@ -0,0 +1,61 @@
+from types import SimpleNamespace
+
+import pytest
+
+from aoc import discover, select
+from bench import _run, bench_group, compare, format_measurement, get_groups
+
+
+def test_get_groups():
+    groups = get_groups(select(discover(), days=[5]))
+
+    assert list(groups) == ["2023/5/1", "2023/5/2"]
+    assert [s.star for s in groups["2023/5/2"]] == [
+        "2_01_slow",
+        "2_02_cache_slower",
+        "2_03_ok",
+    ]
+
+
+@pytest.mark.usefixtures("fresh_modules")
+def test_bench_group():
+    solutions = select(discover(), days=[5], stars=["2"])
+
+    result = bench_group(solutions, sizes=[100, 200], seed=1)
+
+    assert result["sizes"] == [100, 200]
+    for i in range(2):
+        answers = {m[i]["answer"] for m in result["variants"].values()}
+        assert len(answers) == 1
+    assert all(m[0]["time"] > 0 for m in result["variants"].values())
+
+    lines = compare({"groups": {"2023/5/2": result}}, {"groups": {"2023/5/2": result}})
+    assert len(lines) == 6
+    assert "2023/5/2_03_ok" in lines[-1]
+    assert "time x1.00" in lines[-1]
+
+
+def test_run_lines_input(tmp_path):
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("a\nb\n")
+    module = SimpleNamespace(LINES_INPUT=True, solve=lambda lines: lines)
+
+    lines = _run(module, "a\nb\n", input_file)
+
+    # the stream of lines, not the text split in memory
+    assert not isinstance(lines, list)
+    assert list(lines) == ["a", "b"]
+
+
+@pytest.mark.usefixtures("fresh_modules")
+def test_bench_group_process_pool():
+    solutions = select(discover(), days=[1], stars=["1"])
+
+    result = bench_group(solutions, sizes=[100], seed=1)
+
+    # tracemalloc doesn't see the pool, its memory is measured in one process
+    (measurement,) = result["variants"]["1_01_parallel"]
+    assert measurement["memory_processes"] == 1
+    assert "(processes=1)" in format_measurement(solutions[1], measurement)
+    assert "memory_processes" not in result["variants"]["1"][0]
+    assert len({m[0]["answer"] for m in result["variants"].values()}) == 1
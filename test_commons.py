@@ -0,0 +1,120 @@
+import time
+from pathlib import Path
+
+import pytest
+
+from commons import (
+    PeakMemorySampler,
+    get_chunks,
+    get_run_values,
+    map_chunks,
+    iter_lines,
+    map_input,
+    span,
+    tracing,
+)
+
+
+@span("inner")
+def inner(n: int) -> int:
+    return inner(n - 1) + 1 if n else 0
+
+
+def test_span_does_nothing_without_tracing():
+    with span("outer"):
+        assert inner(2) == 2
+
+
+def test_tracing():
+    with tracing() as tracer:
+        with span("outer"):
+            inner(1)
+            start = tracer.sampler.sample()
+            data = [0] * 10**7
+            time.sleep(0.05)
+            del data
+    inner(1)
+
+    assert [(s.name, s.depth) for s in tracer.spans] == [
+        ("inner", 2),
+        ("inner", 1),
+        ("outer", 0),
+    ]
+    outer = tracer.spans[-1]
+    assert all(outer.start <= s.start for s in tracer.spans)
+    assert outer.peak_rss - start >= 10**7 * 8 // 2
+
+    events = tracer.to_chrome_trace()
+    assert [e["name"] for e in events] == ["inner", "inner", "outer"]
+    assert all(e["ph"] == "X" and e["dur"] >= 0 for e in events)
+
+
+def test_tracing_without_memory():
+    with tracing(memory=False) as tracer, span("outer"):
+        pass
+
+    assert tracer.spans[0].rss_change == 0
+
+
+def test_peak_memory_sampler():
+    with PeakMemorySampler() as sampler:
+        start = sampler.sample()
+        data = [0] * 10**7
+        time.sleep(0.05)
+        del data
+        watch = sampler.watch()
+        assert sampler.unwatch(watch) < sampler.peak
+
+    assert sampler.peak - start >= 10**7 * 8 // 2
+
+
+@pytest.mark.parametrize(
+    "text", ["", "a", "a\n", "ab\ncd", "ab\n\ncd\n", "x" * 50 + "\nyy", "abc\n" * 5000]
+)
+@pytest.mark.parametrize("chunk_size", [1, 3, 4096])
+def test_iter_lines(tmp_path, text, chunk_size):
+    path = tmp_path / "input.txt"
+    path.write_text(text)
+
+    assert list(iter_lines(path, chunk_size)) == text.splitlines()
+
+    with map_input(path) as data:
+        assert bytes(data) == text.encode()
+
+
+def test_get_chunks():
+    assert list(get_chunks(b"a1\nbb2\nccc3\nd4", 4)) == [(0, 7), (7, 12), (12, 14)]
+    assert list(get_chunks(b"a1\nbb2\n", 100)) == [(0, 7)]
+    assert list(get_chunks(b"", 4)) == []
+
+
+def _read_chunk(task: tuple[Path, int, int, str]) -> str:
+    path, start, end, suffix = task
+    return path.read_bytes()[start:end].decode() + suffix
+
+
+def test_map_chunks(tmp_path):
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("a1\nbb2\nccc3\nd4")
+
+    assert map_chunks(_read_chunk, input_file, ("!",), 1, 4) == [
+        "a1\nbb2\n!",
+        "ccc3\n!",
+        "d4!",
+    ]
+    assert sorted(map_chunks(_read_chunk, input_file, ("",), 2, 4)) == sorted(
+        ["a1\nbb2\n", "ccc3\n", "d4"]
+    )
+    input_file.write_text("")
+    assert map_chunks(_read_chunk, input_file) == []
+
+
+def test_get_run_values():
+    import numpy as np
+
+    chars = np.frombuffer(b"12 3 456 0", dtype=np.uint8)
+    starts = np.array([0, 3, 5, 9])
+    lengths = np.array([2, 1, 3, 1])
+
+    assert get_run_values(chars, starts, lengths).tolist() == [12, 3, 456, 0]
+    assert get_run_values(chars, starts[:0], lengths[:0]).tolist() == []
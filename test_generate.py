@@ -0,0 +1,47 @@
+import contextlib
+import importlib
+import os
+
+import pytest
+
+from aoc import discover, load_input
+from generate import generate, get_generator, write
+
+SOLUTIONS = [
+    solution
+    for solution in discover()
+    if hasattr(importlib.import_module(solution.module_name), "solve")
+]
+
+
+@pytest.mark.usefixtures("fresh_modules")
+@pytest.mark.parametrize("solution", SOLUTIONS, ids=lambda s: s.name)
+def test_generated_input_is_solvable(solution, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    generator = get_generator(solution.year, solution.day)
+    module = importlib.reload(importlib.import_module(solution.module_name))
+
+    input_file = tmp_path / "input.txt"
+    write(generator, input_file, generator.SIZES[0], seed=1)
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        assert module.solve(load_input(module, input_file)) is not None
+
+
+@pytest.mark.parametrize("day", [1, 2, 3, 4, 5, 6, 18, 20])
+def test_generate_is_seeded(day):
+    generator = get_generator(2023, day)
+
+    assert generate(generator, 20, seed=1) == generate(generator, 20, seed=1)
+    assert generate(generator, 20, seed=1) != generate(generator, 20, seed=2)
+
+
+def test_generate_day_20():
+    text = generate(get_generator(2023, 20), 100, seed=1)
+    modules = {
+        left.strip().lstrip("%&"): [r.strip() for r in rights.split(",")]
+        for left, rights in (line.split("->") for line in text.splitlines())
+    }
+
+    assert len(modules) == 100
+    assert set(sum(modules.values(), [])) - set(modules) == {"rx"}
@@ -0,0 +1,35 @@
+import pstats
+import time
+
+from profiling import profile
+
+
+def _busy(seconds: float) -> int:
+    end = time.perf_counter() + seconds
+    count = 0
+    while time.perf_counter() < end:
+        count += 1
+    return count
+
+
+def _work() -> int:
+    return _busy(0.05) + sum(range(1000))
+
+
+def test_profile(tmp_path):
+    profiled = profile(_work)
+
+    assert profiled.value > 0
+    assert profiled.wall_time >= 0.05
+    assert "_busy" in profiled.format_top(5)
+    assert any(
+        stack.endswith("test_profiling:_work;test_profiling:_busy")
+        for stack in profiled.stacks
+    )
+
+    profiled.save(tmp_path / "work")
+    stats = pstats.Stats(str(tmp_path / "work.pstats"))
+    assert any(name == "_busy" for _, _, name in stats.stats)
+    for line in (tmp_path / "work.folded").read_text().splitlines():
+        stack, count = line.rsplit(" ", 1)
+        assert int(count) > 0
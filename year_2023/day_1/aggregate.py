@@ -0,0 +1,39 @@
+from collections import Counter
+from dataclasses import dataclass
+from typing import Iterable
+
+
+@dataclass
+class Aggregate:
+    """sum of calibration values and optionally their range and histogram"""
+
+    count: int = 0
+    total: int = 0
+    minimum: int | None = None
+    maximum: int | None = None
+    # value -> number of lines, at most 100 keys for two digit values
+    histogram: Counter[int] | None = None
+
+
+def aggregate(
+    values: Iterable[int], min_max: bool = False, histogram: bool = False
+) -> Aggregate:
+    """one pass over `values` in constant memory, values are not kept"""
+    result = Aggregate(histogram=Counter() if histogram else None)
+    if not min_max and not histogram:
+        for value in values:
+            result.count += 1
+            result.total += value
+        return result
+
+    for value in values:
+        result.count += 1
+        result.total += value
+        if min_max:
+            if result.minimum is None or value < result.minimum:
+                result.minimum = value
+            if result.maximum is None or value > result.maximum:
+                result.maximum = value
+        if histogram:
+            result.histogram[value] += 1
+    return result
@@ -0,0 +1,28 @@
+import random
+import string
+from typing import Iterator
+
+from year_2023.day_1.star_2.algo import DIGITS
+
+SIZES = [10**3, 10**4, 10**5, 10**6]
+SCALE = 5 * 10**6
+
+CHARS = string.ascii_lowercase + string.digits[1:]
+
+
+def generate_lines(
+    size: int, seed: int = 0, min_length: int = 5, max_length: int = 40
+) -> Iterator[str]:
+    """
+    `size` - number of calibration lines. Every line has at least one digit and some
+    of them have spelled out digits too.
+    """
+    rng = random.Random(seed)
+    words = list(DIGITS)
+
+    for _ in range(size):
+        chars = rng.choices(CHARS, k=rng.randint(min_length, max_length))
+        chars[rng.randrange(len(chars))] = rng.choice(string.digits[1:])
+        if rng.random() < 0.5:
+            chars.insert(rng.randrange(len(chars) + 1), rng.choice(words))
+        yield "".join(chars) + "\n"
@@ -0,0 +1,57 @@
+"""
+Calibration sum of a whole file, for documents too big for `algo`.
+
+The file is memory-mapped and split into chunks on line boundaries, a process pool
+scans the chunks as raw bytes and returns one partial sum per chunk. A chunk is
+scanned with bytes methods only, no Python code runs per line or per character:
+spelled out digits are replaced by "<word><digit><word>" (the word stays, so words
+overlapping it are still found), everything except digits and newlines is deleted
+and the first and last byte of every line are the digits.
+"""
+import mmap
+from operator import itemgetter
+from pathlib import Path
+
+from commons import map_chunks
+
+CHUNK_SIZE = 2**24
+KEEP = b"0123456789\n"
+DELETE = bytes(byte for byte in range(256) if byte not in KEEP)
+
+Words = tuple[tuple[str, str], ...]
+
+
+def scan_chunk(data: bytes, words: Words = ()) -> int:
+    """
+    `words` must not contain each other (like "one" and "none"), the digit of a word
+    is at its end, so of overlapping words the one ending first is first
+    """
+    for word, digit in words:
+        word_bytes = word.encode()
+        data = data.replace(word_bytes, word_bytes + digit.encode() + word_bytes)
+
+    lines = list(filter(None, data.translate(None, DELETE).split(b"\n")))
+    first = bytes(map(itemgetter(0), lines))
+    last = bytes(map(itemgetter(-1), lines))
+    zero = ord("0")
+    return 10 * (sum(first) - zero * len(first)) + sum(last) - zero * len(last)
+
+
+def _scan_file_chunk(task: tuple[Path, int, int, Words]) -> int:
+    path, start, end, words = task
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return scan_chunk(mm[start:end], words)
+
+
+def scan(
+    path: Path,
+    words: dict[str, str] | None = None,
+    processes: int | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> int:
+    """
+    Sum of the calibration values of `path`, digits spelled out as `words` count too.
+    Lines without any digit are skipped.
+    """
+    words_key = tuple((words or {}).items())
+    return sum(map_chunks(_scan_file_chunk, path, (words_key,), processes, chunk_size))
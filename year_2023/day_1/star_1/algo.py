@@ -18,26 +18,40 @@ Consider your entire calibration document. What is the sum of all of the calibra
 values?
 """
 from pathlib import Path
+from typing import Iterable, Iterator
+
+from commons import iter_lines
+from year_2023.day_1.aggregate import Aggregate, aggregate
 
 CUR_DIR = Path(__file__).parent.resolve()
 input_data_file = CUR_DIR / "input.txt"
 
+LINES_INPUT = True
+
 
-def algo(data: str | list[str]) -> list[int]:
+def get_values(data: str | Iterable[str]) -> Iterator[int]:
     if isinstance(data, str):
         data = data.splitlines()
 
-    result = []
     for line in data:
-        n = int(
+        yield int(
             next(filter(str.isdigit, line)) + next(filter(str.isdigit, reversed(line)))
         )
-        result.append(n)
 
-    return result
+
+def algo(data: str | Iterable[str]) -> list[int]:
+    return list(get_values(data))
+
+
+def solve(data: str | Iterable[str]) -> int:
+    return sum(get_values(data))
+
+
+def solve_stats(
+    data: str | Iterable[str], min_max: bool = True, histogram: bool = False
+) -> Aggregate:
+    return aggregate(get_values(data), min_max, histogram)
 
 
 if __name__ == "__main__":
-    result = algo(input_data_file.read_text())
-    print(result)
-    print("sum:", sum(result))
+    print(solve_stats(iter_lines(input_data_file), histogram=True))
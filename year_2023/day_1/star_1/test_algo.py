@@ -1,6 +1,6 @@
 from textwrap import dedent
 
-from .algo import algo
+from .algo import algo, solve_stats
 
 
 def test_algo():
@@ -17,3 +17,12 @@ def test_algo():
         )
         == [12, 38, 15, 77]
     )
+
+
+def test_solve_stats():
+    lines = iter(["1abc2", "pqr3stu8vwx", "a1b2c3d4e5f", "treb7uchet"])
+
+    stats = solve_stats(lines)
+
+    assert (stats.count, stats.total, stats.minimum, stats.maximum) == (4, 142, 12, 77)
+    assert stats.histogram is None
@@ -0,0 +1,17 @@
+from pathlib import Path
+
+from year_2023.day_1.scan import scan
+
+CUR_DIR = Path(__file__).parent.resolve()
+input_data_file = CUR_DIR / "input.txt"
+
+# the file is scanned in chunks by a process pool, see `day_1.scan`
+PATH_INPUT = True
+
+
+def solve(path: Path, processes: int | None = None) -> int:
+    return scan(path, processes=processes)
+
+
+if __name__ == "__main__":
+    print("sum:", solve(input_data_file))
@@ -0,0 +1,20 @@
+from textwrap import dedent
+
+from .algo import solve
+
+
+def test_solve(tmp_path):
+    input_file = tmp_path / "input.txt"
+    input_file.write_text(
+        dedent(
+            """\
+            1abc2
+            pqr3stu8vwx
+            a1b2c3d4e5f
+            treb7uchet
+            """
+        )
+    )
+
+    assert solve(input_file) == 142
+    assert solve(input_file, processes=2) == 142
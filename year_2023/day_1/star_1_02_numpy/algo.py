@@ -0,0 +1,58 @@
+import mmap
+import os
+from pathlib import Path
+
+from commons import get_chunks
+from year_2023.day_1.scan import CHUNK_SIZE
+
+CUR_DIR = Path(__file__).parent.resolve()
+input_data_file = CUR_DIR / "input.txt"
+
+PATH_INPUT = True
+
+
+def solve_chunk(data) -> int:
+    """
+    `data` - uint8 array of whole lines. Positions of all digits are sorted, so the
+    first digit of a line is the first digit at or after its start and the last one is
+    the one before the first digit after its end. Lines without a digit are skipped.
+    """
+    import numpy as np
+
+    if len(data) == 0:
+        return 0
+    digits = np.flatnonzero((data >= ord("0")) & (data <= ord("9")))
+    ends = np.flatnonzero(data == ord("\n"))
+    if len(ends) == 0 or ends[-1] != len(data) - 1:
+        ends = np.append(ends, len(data))
+    starts = np.concatenate(([0], ends[:-1] + 1))
+
+    first = np.searchsorted(digits, starts)
+    last = np.searchsorted(digits, ends) - 1
+    has_digit = first <= last
+    first_digits = data[digits[first[has_digit]]].astype(np.int64) - ord("0")
+    last_digits = data[digits[last[has_digit]]].astype(np.int64) - ord("0")
+    return int(10 * first_digits.sum() + last_digits.sum())
+
+
+def solve(path: Path, chunk_size: int = CHUNK_SIZE) -> int:
+    """chunks of `chunk_size` bytes keep the arrays of positions small"""
+    import numpy as np
+
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            data = np.frombuffer(mm, dtype=np.uint8)
+            try:
+                return sum(
+                    solve_chunk(data[start:end])
+                    for start, end in get_chunks(mm, chunk_size)
+                )
+            finally:
+                # the mmap can't be closed while an array uses its buffer
+                del data
+
+
+if __name__ == "__main__":
+    print("sum:", solve(input_data_file))
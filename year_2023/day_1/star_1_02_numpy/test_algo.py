@@ -0,0 +1,31 @@
+from textwrap import dedent
+
+from year_2023.day_1.generate import generate_lines
+from year_2023.day_1.star_1.algo import solve as solve_lines
+
+from .algo import solve
+
+
+def test_solve(tmp_path):
+    input_file = tmp_path / "input.txt"
+    input_file.write_text(
+        dedent(
+            """\
+            1abc2
+            pqr3stu8vwx
+            no digits
+
+            a1b2c3d4e5f
+            treb7uchet"""
+        )
+    )
+
+    assert solve(input_file) == 142
+
+
+def test_solve_generated(tmp_path):
+    lines = list(generate_lines(2000, seed=1))
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("".join(lines))
+
+    assert solve(input_file, chunk_size=1000) == solve_lines(lines)
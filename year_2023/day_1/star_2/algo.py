@@ -20,11 +20,16 @@ together produces 281.
 What is the sum of all of the calibration values?
 """
 from pathlib import Path
-from typing import Callable
+from typing import Iterable, Iterator
+
+from commons import iter_lines
+from year_2023.day_1.aggregate import Aggregate, aggregate
 
 CUR_DIR = Path(__file__).parent.resolve()
 input_data_file = CUR_DIR / "input.txt"
 
+LINES_INPUT = True
+
 
 DIGITS = {
     "one": "1",
@@ -38,42 +43,97 @@ DIGITS = {
     "nine": "9",
 }
 
-DIGITS_REVERSED = {"".join(reversed(k)): v for k, v in DIGITS.items()}
-
 
-def get_digit(revers: bool = False) -> Callable[[str], str | None]:
-    chars = ""
-    digits = DIGITS_REVERSED if revers else DIGITS
+class _Automaton:
+    """
+    Aho-Corasick automaton of `patterns` compiled to a DFA: every state has a
+    transition for every character of the patterns, any other character goes back to
+    the start. One dict lookup per character, however many patterns there are.
+    """
+
+    def __init__(self, patterns: dict[str, str]):
+        self.goto: list[dict[str, int]] = [{}]
+        self.output: list[str | None] = [None]
+
+        for pattern, value in patterns.items():
+            state = 0
+            for char in pattern:
+                if char not in self.goto[state]:
+                    self.goto.append({})
+                    self.output.append(None)
+                    self.goto[state][char] = len(self.goto) - 1
+                state = self.goto[state][char]
+            self.output[state] = value
+
+        # breadth first, the failure state is always shallower and done already
+        fail = [0] * len(self.goto)
+        queue = list(self.goto[0].values())
+        for state in queue:
+            edges = self.goto[state]
+            self.goto[state] = {**self.goto[fail[state]], **edges}
+            if self.output[state] is None:
+                self.output[state] = self.output[fail[state]]
+            for char, next_state in edges.items():
+                fail[next_state] = self.goto[fail[state]].get(char, 0)
+                queue.append(next_state)
+
+    def find(self, chars: Iterable[str]) -> str | None:
+        """value of the pattern that ends first"""
+        goto, output = self.goto, self.output
+        state = 0
+        for char in chars:
+            state = goto[state].get(char, 0)
+            if output[state] is not None:
+                return output[state]
+        return None
+
+
+class DigitMatcher:
+    """
+    First and last digit of a line, written as a digit or as one of `words`, each in
+    one pass over the line.
+    """
+
+    def __init__(self, words: dict[str, str] = DIGITS):
+        patterns = {str(digit): str(digit) for digit in range(10)} | words
+        self._forward = _Automaton(patterns)
+        # the last digit is the first one of the reversed line
+        self._backward = _Automaton({k[::-1]: v for k, v in patterns.items()})
+
+    def first(self, line: str) -> str | None:
+        return self._forward.find(line)
+
+    def last(self, line: str) -> str | None:
+        return self._backward.find(reversed(line))
+
+
+def get_values(
+    data: str | Iterable[str], words: dict[str, str] = DIGITS
+) -> Iterator[int]:
+    if isinstance(data, str):
+        data = data.splitlines()
 
-    def _get_digit(char: str) -> str | None:
-        if char.isdigit():
-            return char
-        nonlocal chars
-        chars += char
+    matcher = DigitMatcher(words)
+    for line in data:
+        yield int(matcher.first(line) + matcher.last(line))
 
-        for digit_word in digits:
-            if digit_word in chars:
-                return digits[digit_word]
 
-    return _get_digit
+def algo(data: str | Iterable[str], words: dict[str, str] = DIGITS) -> list[int]:
+    return list(get_values(data, words))
 
 
-def algo(data: str | list[str]) -> list[int]:
-    if isinstance(data, str):
-        data = data.splitlines()
+def solve(data: str | Iterable[str]) -> int:
+    return sum(get_values(data))
 
-    result = []
-    for line in data:
-        n = int(
-            next(filter(None, map(get_digit(), line)))
-            + next(filter(None, map(get_digit(True), reversed(line))))
-        )
-        result.append(n)
 
-    return result
+def solve_stats(
+    data: str | Iterable[str],
+    words: dict[str, str] = DIGITS,
+    min_max: bool = True,
+    histogram: bool = False,
+) -> Aggregate:
+    return aggregate(get_values(data, words), min_max, histogram)
 
 
 if __name__ == "__main__":
-    result = algo(input_data_file.read_text())
-    print(result)
-    print("sum:", sum(result))
+    print(solve_stats(iter_lines(input_data_file), histogram=True))
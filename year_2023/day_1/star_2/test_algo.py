@@ -1,6 +1,6 @@
 from textwrap import dedent
 
-from .algo import algo
+from .algo import DigitMatcher, algo, solve_stats
 
 
 def test_algo():
@@ -20,3 +20,28 @@ zoneight234
         )
         == [29, 83, 13, 24, 42, 14, 76]
     )
+
+
+def test_algo_words():
+    words = {"een": "1", "twee": "2", "drie": "3", "eentwee": "9"}
+
+    assert algo(["xeentweex", "tweedrie", "drieen4"], words) == [12, 23, 34]
+
+
+def test_digit_matcher():
+    matcher = DigitMatcher()
+
+    assert matcher.first("oneight") == "1"
+    assert matcher.last("oneight") == "8"
+    assert matcher.first("xtwone3four") == "2"
+    assert matcher.last("xtwone3four") == "4"
+    assert matcher.first("abc") is None
+
+
+def test_solve_stats():
+    lines = iter(["two1nine", "eightwothree", "abcone2threexyz", "xtwone3four"])
+
+    stats = solve_stats(lines, histogram=True)
+
+    assert (stats.count, stats.total, stats.minimum, stats.maximum) == (4, 149, 13, 83)
+    assert stats.histogram == {29: 1, 83: 1, 13: 1, 24: 1}
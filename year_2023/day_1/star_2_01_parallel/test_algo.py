@@ -0,0 +1,23 @@
+from textwrap import dedent
+
+from .algo import solve
+
+
+def test_solve(tmp_path):
+    input_file = tmp_path / "input.txt"
+    input_file.write_text(
+        dedent(
+            """\
+            two1nine
+            eightwothree
+            abcone2threexyz
+            xtwone3four
+            4nineeightseven2
+            zoneight234
+            7pqrstsixteen
+            """
+        )
+    )
+
+    assert solve(input_file) == 281
+    assert solve(input_file, processes=2) == 281
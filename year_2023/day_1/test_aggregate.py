@@ -0,0 +1,11 @@
+from collections import Counter
+
+from year_2023.day_1.aggregate import Aggregate, aggregate
+
+
+def test_aggregate():
+    assert aggregate(iter([12, 38, 15, 77, 12])) == Aggregate(5, 154)
+    assert aggregate(iter([12, 38, 15, 77, 12]), min_max=True, histogram=True) == (
+        Aggregate(5, 154, 12, 77, Counter({12: 2, 38: 1, 15: 1, 77: 1}))
+    )
+    assert aggregate(iter([]), min_max=True) == Aggregate()
@@ -0,0 +1,19 @@
+from year_2023.day_1.generate import generate_lines
+from year_2023.day_1.scan import scan, scan_chunk
+from year_2023.day_1.star_1.algo import solve as solve_1
+from year_2023.day_1.star_2.algo import DIGITS
+from year_2023.day_1.star_2.algo import solve as solve_2
+
+
+def test_scan_chunk():
+    assert scan_chunk(b"1abc2\nno digits\ntreb7uchet") == 12 + 77
+    assert scan_chunk(b"eightwo\nxtwone3four", tuple(DIGITS.items())) == 82 + 24
+
+
+def test_scan(tmp_path):
+    lines = list(generate_lines(2000, seed=1))
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("".join(lines))
+
+    assert scan(input_file, chunk_size=1000) == solve_1(lines)
+    assert scan(input_file, DIGITS, processes=2, chunk_size=1000) == solve_2(lines)
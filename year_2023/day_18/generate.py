@@ -0,0 +1,29 @@
+import random
+from typing import Iterator
+
+SIZES = [10, 20, 40, 80]
+SCALE = 10**6
+
+
+def generate_lines(size: int, seed: int = 0, max_length: int = 6) -> Iterator[str]:
+    """
+    `size` - number of dig plan lines (vertices). The trench is a staircase going
+    right and down, closed by one line left and one line up.
+    """
+    rng = random.Random(seed)
+    width = height = 0
+
+    def _line(direction: str, length: int) -> str:
+        return f"{direction} {length} (#{rng.randrange(0x1000000):06x})\n"
+
+    for _ in range(max(1, (size - 2) // 2)):
+        length = rng.randint(1, max_length)
+        width += length
+        yield _line("R", length)
+
+        length = rng.randint(1, max_length)
+        height += length
+        yield _line("D", length)
+
+    yield _line("L", width)
+    yield _line("U", height)
@@ -64,9 +64,6 @@ how many cubic meters of lava could it hold?
 """
 from pathlib import Path
 
-import pygame
-from tqdm import tqdm
-
 CUR_DIR = Path(__file__).parent.resolve()
 input_data_file = CUR_DIR / "input.txt"
 
@@ -104,6 +101,9 @@ def print_area(area: list[list[str]]):
 
 
 def algo(text: str) -> int:
+    import pygame
+    from tqdm import tqdm
+
     pygame.init()
     size = (800, 600)
     screen = pygame.display.set_mode(size, flags=pygame.RESIZABLE)
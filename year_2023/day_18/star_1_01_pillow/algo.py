@@ -1,10 +1,7 @@
 from array import array
 from pathlib import Path
 
-from PIL import Image
-from tqdm import tqdm
-
-from commons import get_memory_usage
+from commons import get_memory_usage, get_peak_memory_usage, span
 from year_2023.day_18.star_1_00_pygame_failure.algo import Plan, parse, print_area
 
 CUR_DIR = Path(__file__).parent.resolve()
@@ -43,8 +40,10 @@ def get_start_point(maxes: dict[str, int]) -> tuple[int, int]:
     return abs(maxes["u"]), abs(maxes["l"])
 
 
-def algo(text: str) -> int:
-    plan = parse(text)
+def solve(plan: Plan) -> int:
+    from PIL import Image
+    from tqdm import tqdm
+
     maxes = find_min_max_left_right_etc(plan)
     print(f"{maxes=}")
 
@@ -70,20 +69,21 @@ def algo(text: str) -> int:
     area[y][x] = "#"
     draw_pixel(y, x)
 
-    for direction, length in plan:
-        while length > 0:
-            match direction:
-                case "l":
-                    x -= 1
-                case "r":
-                    x += 1
-                case "u":
-                    y -= 1
-                case "d":
-                    y += 1
-            area[y][x] = "#"
-            length -= 1
-            draw_pixel(y, x)
+    with span("dig"):
+        for direction, length in plan:
+            while length > 0:
+                match direction:
+                    case "l":
+                        x -= 1
+                    case "r":
+                        x += 1
+                    case "u":
+                        y -= 1
+                    case "d":
+                        y += 1
+                area[y][x] = "#"
+                length -= 1
+                draw_pixel(y, x)
 
     image.save("plan.png")
     print_area(area)
@@ -99,7 +99,7 @@ def algo(text: str) -> int:
     # list implementation
     points = [start]
 
-    with tqdm(total=y_x[0] * y_x[1]) as pbar:
+    with span("flood fill"), tqdm(total=y_x[0] * y_x[1]) as pbar:
         # array implementation
         # while array_length:
         # list implementation
@@ -146,10 +146,14 @@ def algo(text: str) -> int:
 
     print(f"{cubes_outside=}")
     result = y_x[0] * y_x[1] - cubes_outside
-    print(f"{get_memory_usage()=}")
+    print(f"{get_memory_usage()=} {get_peak_memory_usage()=}")
     return result
 
 
+def algo(text: str) -> int:
+    return solve(parse(text))
+
+
 def main():
     text = """R 6 (#70c710)
 D 5 (#0dc571)
@@ -0,0 +1,139 @@
+"""
+Answers of both stars for a game log that grows, only appended records are parsed.
+
+`Follower` keeps `Totals` (see `scan`) and the byte offset up to which the log was
+read. A record without its newline is not complete yet, it waits for the next update.
+The offset and the totals are saved as a small JSON checkpoint after every update,
+so a restarted follower continues where it stopped. A log that got shorter or was
+replaced (another inode) is read again from the start.
+
+    python -m year_2023.day_2.follow games.txt --checkpoint games.json
+"""
+import argparse
+import json
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Iterator
+
+from year_2023.day_2.scan import COLORS, Totals, scan_chunk
+
+CHUNK_SIZE = 2**24
+
+
+@dataclass
+class Checkpoint:
+    inode: int = 0
+    offset: int = 0
+    colors: tuple[int, int, int] = COLORS
+    totals: Totals = field(default_factory=Totals)
+
+    @classmethod
+    def load(cls, path: Path) -> "Checkpoint | None":
+        """None for a missing or malformed checkpoint, the log is read from the start"""
+        try:
+            checkpoint = json.loads(path.read_text())
+            return cls(
+                checkpoint["inode"],
+                checkpoint["offset"],
+                tuple(checkpoint["colors"]),
+                Totals(**checkpoint["totals"]),
+            )
+        except (FileNotFoundError, KeyError, TypeError, ValueError):
+            # `json.JSONDecodeError` is a `ValueError`
+            return None
+
+    def save(self, path: Path):
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(asdict(self)))
+        os.replace(tmp_path, path)
+
+
+class Follower:
+    def __init__(
+        self,
+        path: Path,
+        checkpoint_path: Path | None = None,
+        colors: tuple[int, int, int] = COLORS,
+    ):
+        self.path = path
+        self.checkpoint_path = checkpoint_path
+        self.colors = tuple(colors)
+
+        checkpoint = Checkpoint.load(checkpoint_path) if checkpoint_path else None
+        if checkpoint is None or checkpoint.colors != self.colors:
+            checkpoint = Checkpoint(colors=self.colors)
+        self.checkpoint = checkpoint
+
+    @property
+    def totals(self) -> Totals:
+        return self.checkpoint.totals
+
+    def update(self) -> bool:
+        """parses records appended since the last update, True if there were any"""
+        checkpoint = self.checkpoint
+        updated = False
+
+        with self.path.open("rb") as f:
+            stat = os.fstat(f.fileno())
+            if stat.st_ino != checkpoint.inode or stat.st_size < checkpoint.offset:
+                checkpoint = self.checkpoint = Checkpoint(
+                    stat.st_ino, colors=self.colors
+                )
+                updated = True
+
+            f.seek(checkpoint.offset)
+            pending = b""
+            while block := f.read(CHUNK_SIZE):
+                pending += block
+                end = pending.rfind(b"\n") + 1
+                if end == 0:
+                    continue
+                checkpoint.totals += scan_chunk(pending[:end], self.colors)
+                checkpoint.offset += end
+                pending = pending[end:]
+                updated = True
+
+        if updated and self.checkpoint_path is not None:
+            checkpoint.save(self.checkpoint_path)
+        return updated
+
+    def follow(self, interval: float = 1.0) -> Iterator[Totals]:
+        """current totals and then new ones after every change of the log"""
+        self.update()
+        yield self.totals
+        while True:
+            time.sleep(interval)
+            if self.update():
+                yield self.totals
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="follow", description="Follow a growing day 2 game log."
+    )
+    parser.add_argument("path", type=Path)
+    parser.add_argument("-c", "--checkpoint", type=Path, help="JSON with the progress")
+    parser.add_argument("--colors", type=int, nargs=3, default=COLORS)
+    parser.add_argument("--interval", type=float, default=1.0, help="in seconds")
+    parser.add_argument(
+        "--once", action="store_true", help="update once and exit, don't follow"
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None):
+    args = get_parser().parse_args(argv)
+    follower = Follower(args.path, args.checkpoint, args.colors)
+
+    if args.once:
+        follower.update()
+        print(follower.totals)
+        return
+    for totals in follower.follow(args.interval):
+        print(totals, flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Games parsed once into columns: game ids and the maximum number of red, green and
+blue cubes of any grab of the game. A game is possible with a bag iff its maxima fit
+in the bag, so any number of bags (star 1) and the powers (star 2) are answered with
+array operations, without parsing again.
+"""
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable
+
+from year_2023.day_2.tokenizer import iter_maxima, read_maxima
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# cells of the (bags x games) boolean matrix of one batch of bags
+BATCH_SIZE = 2**24
+
+
+@dataclass
+class Games:
+    ids: "np.ndarray"
+    red: "np.ndarray"
+    green: "np.ndarray"
+    blue: "np.ndarray"
+
+    @classmethod
+    def from_maxima(cls, parts: Iterable[tuple["np.ndarray", "np.ndarray"]]) -> "Games":
+        """`parts` - game ids and their (games x 3) maxima, see `tokenizer`"""
+        import numpy as np
+
+        ids, maxima = [np.zeros(0, dtype=np.int64)], [np.zeros((0, 3), dtype=np.int64)]
+        for part_ids, part_maxima in parts:
+            ids.append(part_ids)
+            maxima.append(part_maxima)
+        red, green, blue = np.concatenate(maxima).T
+        return cls(np.concatenate(ids), red, green, blue)
+
+    @classmethod
+    def from_lines(cls, data: str | bytes | Iterable[str]) -> "Games":
+        return cls.from_maxima(iter_maxima(data))
+
+    @classmethod
+    def from_file(cls, path: Path) -> "Games":
+        return cls.from_maxima(read_maxima(path))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def get_possible_id_sums(self, bags: Iterable[Iterable[int]]) -> "np.ndarray":
+        """sum of ids of the games possible with every bag of (red, green, blue)"""
+        import numpy as np
+
+        bags = np.asarray(bags, dtype=np.int64).reshape(-1, 3)
+        result = np.empty(len(bags), dtype=np.int64)
+        step = max(1, BATCH_SIZE // max(1, len(self)))
+        # float matrix product is a lot faster than int one (BLAS) and exact while
+        # the sums fit in the 53 bits of the mantissa
+        dtype = np.float64 if int(np.abs(self.ids).sum()) < 2**53 else np.int64
+        ids = self.ids.astype(dtype)
+
+        for start in range(0, len(bags), step):
+            batch = bags[start : start + step, :, None]
+            possible = (
+                (self.red <= batch[:, 0])
+                & (self.green <= batch[:, 1])
+                & (self.blue <= batch[:, 2])
+            )
+            result[start : start + step] = possible.astype(dtype) @ ids
+        return result
+
+    def get_powers(self) -> "np.ndarray":
+        return self.red * self.green * self.blue
@@ -0,0 +1,23 @@
+import random
+from typing import Iterator
+
+SIZES = [10**3, 10**4, 10**5, 10**6]
+SCALE = 10**6
+
+COLORS = ["red", "green", "blue"]
+
+
+def generate_lines(
+    size: int, seed: int = 0, max_grabs: int = 6, max_cubes: int = 20
+) -> Iterator[str]:
+    """`size` - number of games"""
+    rng = random.Random(seed)
+
+    for game_number in range(1, size + 1):
+        grabs = []
+        for _ in range(rng.randint(1, max_grabs)):
+            colors = rng.sample(COLORS, rng.randint(1, len(COLORS)))
+            grabs.append(
+                ", ".join(f"{rng.randint(1, max_cubes)} {color}" for color in colors)
+            )
+        yield f"Game {game_number}: {'; '.join(grabs)}\n"
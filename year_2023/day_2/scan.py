@@ -0,0 +1,74 @@
+"""
+Both stars of a whole game log in one pass, for logs too big for one process.
+
+The file is memory-mapped and split into chunks on line boundaries, a process pool
+tokenizes the chunks (see `tokenizer`) and returns small `Totals` per chunk, which
+add up to the totals of the file.
+
+    python -m year_2023.day_2.scan games.txt
+"""
+import mmap
+import sys
+from dataclasses import dataclass
+from functools import reduce
+from operator import add
+from pathlib import Path
+
+from commons import get_chunks, map_chunks
+from year_2023.day_2.tokenizer import CHUNK_SIZE as TOKENIZER_CHUNK_SIZE
+from year_2023.day_2.tokenizer import parse_maxima
+
+CHUNK_SIZE = 2**24
+COLORS = (12, 13, 14)
+
+
+@dataclass
+class Totals:
+    games: int = 0
+    # star 1
+    possible_id_sum: int = 0
+    # star 2
+    power_sum: int = 0
+
+    def __add__(self, other: "Totals") -> "Totals":
+        return Totals(
+            self.games + other.games,
+            self.possible_id_sum + other.possible_id_sum,
+            self.power_sum + other.power_sum,
+        )
+
+
+def scan_chunk(data, colors: tuple[int, int, int] = COLORS) -> Totals:
+    """`data` - bytes-like with whole records"""
+    totals = Totals()
+    for start, end in get_chunks(data, TOKENIZER_CHUNK_SIZE):
+        ids, maxima = parse_maxima(data[start:end])
+        totals += Totals(
+            len(ids),
+            int(ids[(maxima <= colors).all(axis=1)].sum()),
+            int(maxima.prod(axis=1).sum()),
+        )
+    return totals
+
+
+def _scan_file_chunk(task: tuple[Path, int, int, tuple[int, int, int]]) -> Totals:
+    path, start, end, colors = task
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return scan_chunk(mm[start:end], colors)
+
+
+def scan(
+    path: Path,
+    colors: tuple[int, int, int] = COLORS,
+    processes: int | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> Totals:
+    return reduce(
+        add,
+        map_chunks(_scan_file_chunk, path, (colors,), processes, chunk_size),
+        Totals(),
+    )
+
+
+if __name__ == "__main__":
+    print(scan(Path(sys.argv[1])))
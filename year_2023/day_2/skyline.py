@@ -0,0 +1,147 @@
+"""
+Dominance index of games: which games fit in a bag (red, green, blue), that is whose
+maxima are all at most the bag's, without a scan over all games per bag.
+
+The maxima of every color are ranked among their distinct values and the numbers and
+id sums of games are summed up in a 3D table of prefix sums over the ranks. Cell
+(r, g, b) holds the games with ranks at most (r, g, b), so a bag is three binary
+searches and one lookup. The table has (distinct red x green x blue values) cells,
+above `max_cells` there is no table and bags are answered by `get_ids`.
+
+    python -m year_2023.day_2.skyline 1000000
+"""
+import sys
+import time
+from typing import TYPE_CHECKING, Iterable
+
+from year_2023.day_2.games import Games
+
+if TYPE_CHECKING:
+    import numpy as np
+
+MAX_CELLS = 2**24
+
+
+class DominanceIndex:
+    def __init__(self, games: Games, max_cells: int = MAX_CELLS):
+        import numpy as np
+
+        columns = [games.red, games.green, games.blue]
+        self.values = [np.unique(column) for column in columns]
+        ranks = tuple(
+            np.searchsorted(values, column)
+            for values, column in zip(self.values, columns)
+        )
+
+        shape = tuple(len(values) for values in self.values)
+        self.counts: np.ndarray | None = None
+        self.id_sums: np.ndarray | None = None
+        if np.prod(shape, dtype=np.int64) <= max_cells:
+            self.counts = np.zeros(shape, dtype=np.int64)
+            self.id_sums = np.zeros(shape, dtype=np.int64)
+            np.add.at(self.counts, ranks, 1)
+            np.add.at(self.id_sums, ranks, games.ids)
+            for table in [self.counts, self.id_sums]:
+                for axis in range(3):
+                    np.cumsum(table, axis=axis, out=table)
+
+        # for `get_ids` games by red, the ones with red up to the bag's are a prefix
+        order = np.argsort(games.red, kind="stable")
+        self._ids = games.ids[order]
+        self._red = games.red[order]
+        self._green = games.green[order]
+        self._blue = games.blue[order]
+
+    def _lookup(
+        self, table: "np.ndarray", bags: Iterable[Iterable[int]]
+    ) -> "np.ndarray":
+        import numpy as np
+
+        bags = np.asarray(bags, dtype=np.int64).reshape(-1, 3)
+        ranks = [
+            np.searchsorted(values, bags[:, color], side="right") - 1
+            for color, values in enumerate(self.values)
+        ]
+        # a color below all maxima, no game fits
+        fits = (ranks[0] >= 0) & (ranks[1] >= 0) & (ranks[2] >= 0)
+        result = np.zeros(len(bags), dtype=np.int64)
+        result[fits] = table[ranks[0][fits], ranks[1][fits], ranks[2][fits]]
+        return result
+
+    def get_ids(self, bag: Iterable[int]) -> "np.ndarray":
+        """ids of the games that fit in `bag`, by their red maximum"""
+        import numpy as np
+
+        red, green, blue = bag
+        end = np.searchsorted(self._red, red, side="right")
+        fits = (self._green[:end] <= green) & (self._blue[:end] <= blue)
+        return self._ids[:end][fits]
+
+    def get_counts(self, bags: Iterable[Iterable[int]]) -> "np.ndarray":
+        import numpy as np
+
+        if self.counts is None:
+            return np.array([len(self.get_ids(bag)) for bag in bags], dtype=np.int64)
+        return self._lookup(self.counts, bags)
+
+    def get_id_sums(self, bags: Iterable[Iterable[int]]) -> "np.ndarray":
+        import numpy as np
+
+        if self.id_sums is None:
+            return np.array(
+                [int(self.get_ids(bag).sum()) for bag in bags], dtype=np.int64
+            )
+        return self._lookup(self.id_sums, bags)
+
+
+def _report(name: str, start: float, queries: int = 1):
+    print(f"{name:<24} {(time.perf_counter() - start) / queries * 1e6:12.1f}µs")
+
+
+def _bench(size: int, queries: int = 100, seed: int = 0):
+    """latency of a bag query, the index against `is_grab_possible` over all games"""
+    import random
+
+    from year_2023.day_2.generate import generate_lines
+    from year_2023.day_2.star_1.algo import is_grab_possible, parse_line
+
+    text = "".join(generate_lines(size, seed))
+    rng = random.Random(seed)
+    bags = [[rng.randint(1, 20) for _ in range(3)] for _ in range(queries)]
+
+    start = time.perf_counter()
+    games = [parse_line(line) for line in text.splitlines()]
+    _report("parse_line", start)
+    start = time.perf_counter()
+    index = DominanceIndex(Games.from_lines(text))
+    _report("tokenizer + index", start)
+
+    # per bag
+    brute_bags = bags[: max(1, queries // 100)]
+    start = time.perf_counter()
+    expected = [
+        sum(
+            game_number
+            for game_number, grabs in games
+            if all(is_grab_possible(bag, grab) for grab in grabs)
+        )
+        for bag in brute_bags
+    ]
+    _report("is_grab_possible loop", start, len(brute_bags))
+    start = time.perf_counter()
+    for bag in bags:
+        index.get_id_sums([bag])
+    _report("get_id_sums", start, queries)
+    start = time.perf_counter()
+    id_sums = index.get_id_sums(bags)
+    _report("get_id_sums, all bags", start, queries)
+    start = time.perf_counter()
+    for bag in bags:
+        index.get_ids(bag)
+    _report("get_ids", start, queries)
+
+    assert id_sums[: len(brute_bags)].tolist() == expected
+
+
+if __name__ == "__main__":
+    _bench(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
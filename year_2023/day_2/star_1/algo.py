@@ -37,10 +37,17 @@ Determine which games would have been possible if the bag had been loaded with o
 red cubes, 13 green cubes, and 14 blue cubes. What is the sum of the IDs of those games?
 """
 from pathlib import Path
+from typing import Iterable
+
+from year_2023.day_2.tokenizer import iter_maxima, read_maxima
 
 CUR_DIR = Path(__file__).parent.resolve()
 input_data_file = CUR_DIR / "input.txt"
 
+PATH_INPUT = True
+
+COLORS = [12, 13, 14]
+
 
 def parse_line(line: str) -> tuple[int, list[list[int, int, int]]]:
     game_number, grabs = line.split(":")
@@ -67,24 +74,20 @@ def is_grab_possible(colors: list[int], grab: list[int]) -> bool:
     return True
 
 
-def algo(colors: list, data: str | list[str]) -> list[int]:
-    if isinstance(data, str):
-        data = data.splitlines()
-
+def algo(colors: list, data: str | bytes | Iterable[str]) -> list[int]:
+    """a game is possible if its maxima of every color fit in `colors`"""
     result = []
-    for line in data:
-        game_number, grabs = parse_line(line)
+    for ids, maxima in iter_maxima(data):
+        result += ids[(maxima <= colors).all(axis=1)].tolist()
+    return result
 
-        for grab in grabs:
-            if not is_grab_possible(colors, grab):
-                break
-        else:
-            result.append(game_number)
 
-    return result
+def solve(path: Path) -> int:
+    return sum(
+        int(ids[(maxima <= COLORS).all(axis=1)].sum())
+        for ids, maxima in read_maxima(path)
+    )
 
 
 if __name__ == "__main__":
-    result = algo([12, 13, 14], input_data_file.read_text())
-    print(result)
-    print("sum:", sum(result))
+    print("sum:", solve(input_data_file))
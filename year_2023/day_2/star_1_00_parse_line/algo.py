@@ -0,0 +1,36 @@
+from pathlib import Path
+from typing import Iterable
+
+from year_2023.day_2.star_1.algo import COLORS, is_grab_possible, parse_line
+
+CUR_DIR = Path(__file__).parent.resolve()
+input_data_file = CUR_DIR / "input.txt"
+
+LINES_INPUT = True
+
+
+def algo(colors: list, data: str | Iterable[str]) -> list[int]:
+    if isinstance(data, str):
+        data = data.splitlines()
+
+    result = []
+    for line in data:
+        game_number, grabs = parse_line(line)
+
+        for grab in grabs:
+            if not is_grab_possible(colors, grab):
+                break
+        else:
+            result.append(game_number)
+
+    return result
+
+
+def solve(data: str | Iterable[str]) -> int:
+    return sum(algo(COLORS, data))
+
+
+if __name__ == "__main__":
+    result = algo(COLORS, input_data_file.read_text())
+    print(result)
+    print("sum:", sum(result))
@@ -0,0 +1,19 @@
+from pathlib import Path
+
+from year_2023.day_2.scan import COLORS, scan
+
+CUR_DIR = Path(__file__).parent.resolve()
+input_data_file = CUR_DIR / "input.txt"
+
+# the file is scanned in chunks by a process pool, see `day_2.scan`
+PATH_INPUT = True
+
+
+def solve(
+    path: Path, colors: tuple[int, int, int] = COLORS, processes: int | None = None
+) -> int:
+    return scan(path, colors, processes).possible_id_sum
+
+
+if __name__ == "__main__":
+    print("sum:", solve(input_data_file))
@@ -26,37 +26,28 @@ it was 12, 1560, 630, and 36, respectively. Adding up these five powers produces
 For each game, find the minimum set of cubes that must have been present. What is the
 sum of the power of these sets?
 """
-from functools import reduce
 from pathlib import Path
+from typing import Iterable
 
-from year_2023.day_2.star_1.algo import parse_line
+from year_2023.day_2.tokenizer import iter_maxima, read_maxima
 
 CUR_DIR = Path(__file__).parent.resolve()
 input_data_file = CUR_DIR / "input.txt"
 
+PATH_INPUT = True
 
-def algo(data: str | list[str]) -> list[int]:
-    if isinstance(data, str):
-        data = data.splitlines()
 
+def algo(data: str | bytes | Iterable[str]) -> list[int]:
+    """the fewest cubes of a color that make the game possible are its maximum"""
     result = []
-    for line in data:
-        game_number, grabs = parse_line(line)
-
-        max_grab = [0, 0, 0]
-        for grab in grabs:
-            max_grab = [
-                max(max_grab[0], grab[0]),
-                max(max_grab[1], grab[1]),
-                max(max_grab[2], grab[2]),
-            ]
+    for _, maxima in iter_maxima(data):
+        result += maxima.prod(axis=1).tolist()
+    return result
 
-        result.append(reduce(lambda a, b: a * b, max_grab))
 
-    return result
+def solve(path: Path) -> int:
+    return sum(int(maxima.prod(axis=1).sum()) for _, maxima in read_maxima(path))
 
 
 if __name__ == "__main__":
-    result = algo(input_data_file.read_text())
-    print(result)
-    print("sum:", sum(result))
+    print("sum:", solve(input_data_file))
@@ -0,0 +1,41 @@
+from functools import reduce
+from pathlib import Path
+from typing import Iterable
+
+from year_2023.day_2.star_1.algo import parse_line
+
+CUR_DIR = Path(__file__).parent.resolve()
+input_data_file = CUR_DIR / "input.txt"
+
+LINES_INPUT = True
+
+
+def algo(data: str | Iterable[str]) -> list[int]:
+    if isinstance(data, str):
+        data = data.splitlines()
+
+    result = []
+    for line in data:
+        game_number, grabs = parse_line(line)
+
+        max_grab = [0, 0, 0]
+        for grab in grabs:
+            max_grab = [
+                max(max_grab[0], grab[0]),
+                max(max_grab[1], grab[1]),
+                max(max_grab[2], grab[2]),
+            ]
+
+        result.append(reduce(lambda a, b: a * b, max_grab))
+
+    return result
+
+
+def solve(data: str | Iterable[str]) -> int:
+    return sum(algo(data))
+
+
+if __name__ == "__main__":
+    result = algo(input_data_file.read_text())
+    print(result)
+    print("sum:", sum(result))
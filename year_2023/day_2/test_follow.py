@@ -0,0 +1,85 @@
+import os
+
+import pytest
+
+from year_2023.day_2.follow import Checkpoint, Follower
+from year_2023.day_2.generate import generate_lines
+from year_2023.day_2.scan import Totals, scan
+
+LINES = list(generate_lines(300, seed=1))
+
+
+def _append(path, text):
+    with path.open("a") as f:
+        f.write(text)
+
+
+def test_follower(tmp_path):
+    log = tmp_path / "games.txt"
+    checkpoint = tmp_path / "checkpoint.json"
+    log.write_text("".join(LINES[:100]))
+
+    follower = Follower(log, checkpoint)
+    assert follower.update()
+    assert follower.totals == scan(log, processes=1)
+    assert not follower.update()
+
+    # the last record isn't complete yet
+    _append(log, "".join(LINES[100:200]) + LINES[200][:10])
+    assert follower.update()
+    assert follower.totals.games == 200
+    assert follower.checkpoint.offset == len("".join(LINES[:200]))
+
+    _append(log, LINES[200][10:] + "".join(LINES[201:]))
+    # a restarted follower continues from the checkpoint
+    follower = Follower(log, checkpoint)
+    assert follower.totals.games == 200
+    assert follower.update()
+    assert follower.totals == scan(log, processes=1)
+
+
+def test_follower_log_replaced(tmp_path):
+    log = tmp_path / "games.txt"
+    log.write_text("".join(LINES))
+    follower = Follower(log)
+    follower.update()
+
+    replaced = tmp_path / "new.txt"
+    replaced.write_text("".join(LINES[:5]))
+    os.replace(replaced, log)
+
+    assert follower.update()
+    assert follower.totals == scan(log, processes=1)
+
+
+def test_checkpoint(tmp_path):
+    path = tmp_path / "checkpoint.json"
+    checkpoint = Checkpoint(1, 2, (3, 4, 5), Totals(6, 7, 8))
+
+    checkpoint.save(path)
+
+    assert Checkpoint.load(path) == checkpoint
+    assert Checkpoint.load(tmp_path / "missing.json") is None
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "{",
+        "[]",
+        '{"inode": 1}',
+        '{"inode": 1, "offset": 2, "colors": [3, 4, 5], "totals": {"wins": 1}}',
+        '{"inode": 1, "offset": 2, "colors": 3, "totals": {}}',
+    ],
+)
+def test_checkpoint_malformed(tmp_path, text):
+    path = tmp_path / "checkpoint.json"
+    path.write_text(text)
+    log = tmp_path / "games.txt"
+    log.write_text("".join(LINES))
+
+    assert Checkpoint.load(path) is None
+    # the follower starts over
+    follower = Follower(log, path)
+    assert follower.update()
+    assert follower.totals == scan(log, processes=1)
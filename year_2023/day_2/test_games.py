@@ -0,0 +1,44 @@
+from textwrap import dedent
+
+from year_2023.day_2.games import Games
+from year_2023.day_2.generate import generate_lines
+from year_2023.day_2.star_1.algo import algo
+from year_2023.day_2.star_2.algo import algo as algo_2
+
+TEST_DATA = dedent(
+    """\
+    Game 1: 3 blue, 4 red; 1 red, 2 green, 6 blue; 2 green
+    Game 2: 1 blue, 2 green; 3 green, 4 blue, 1 red; 1 green, 1 blue
+    Game 3: 8 green, 6 blue, 20 red; 5 blue, 4 red, 13 green; 5 green, 1 red
+    Game 4: 1 green, 3 red, 6 blue; 3 green, 6 red; 3 green, 15 blue, 14 red
+    Game 5: 6 red, 1 blue, 3 green; 2 blue, 1 red, 2 green
+    """
+)
+
+
+def test_games():
+    games = Games.from_lines(TEST_DATA)
+
+    assert list(games.ids) == [1, 2, 3, 4, 5]
+    assert list(games.red) == [4, 1, 20, 14, 6]
+    assert list(
+        games.get_possible_id_sums([[12, 13, 14], [0, 0, 0], [20, 20, 20]])
+    ) == [
+        8,
+        0,
+        15,
+    ]
+    assert list(games.get_powers()) == [48, 12, 1560, 630, 36]
+
+
+def test_games_generated(monkeypatch):
+    monkeypatch.setattr("year_2023.day_2.games.BATCH_SIZE", 1000)
+    lines = "".join(generate_lines(500, seed=1)).splitlines()
+    bags = [[r, g, b] for r in (5, 12, 20) for g in (5, 13, 20) for b in (1, 14, 20)]
+
+    games = Games.from_lines(lines)
+
+    assert list(games.get_possible_id_sums(bags)) == [
+        sum(algo(bag, lines)) for bag in bags
+    ]
+    assert games.get_powers().sum() == sum(algo_2(lines))
@@ -0,0 +1,18 @@
+from year_2023.day_2.generate import generate_lines
+from year_2023.day_2.scan import Totals, scan
+from year_2023.day_2.star_1.algo import COLORS, algo
+from year_2023.day_2.star_2.algo import algo as algo_2
+
+
+def test_totals():
+    assert Totals(1, 2, 3) + Totals(10, 20, 30) == Totals(11, 22, 33)
+
+
+def test_scan(tmp_path):
+    text = "".join(generate_lines(2000, seed=1))
+    input_file = tmp_path / "input.txt"
+    input_file.write_text(text)
+    expected = Totals(2000, sum(algo(COLORS, text)), sum(algo_2(text)))
+
+    assert scan(input_file, processes=1) == expected
+    assert scan(input_file, processes=2, chunk_size=10000) == expected
@@ -0,0 +1,22 @@
+import pytest
+
+from year_2023.day_2.games import Games
+from year_2023.day_2.generate import generate_lines
+from year_2023.day_2.skyline import DominanceIndex
+from year_2023.day_2.star_1.algo import algo
+
+BAGS = [[r, g, b] for r in (0, 5, 12, 20, 30) for g in (1, 13, 20) for b in (2, 14, 25)]
+
+
+@pytest.mark.parametrize("max_cells", [1, 2**24])
+def test_dominance_index(max_cells):
+    lines = "".join(generate_lines(300, seed=1)).splitlines()
+    games = Games.from_lines(lines)
+
+    index = DominanceIndex(games, max_cells)
+
+    assert (index.counts is None) == (max_cells == 1)
+    expected = [algo(bag, lines) for bag in BAGS]
+    assert index.get_id_sums(BAGS).tolist() == list(map(sum, expected))
+    assert index.get_counts(BAGS).tolist() == list(map(len, expected))
+    assert [sorted(index.get_ids(bag).tolist()) for bag in BAGS] == expected
@@ -0,0 +1,78 @@
+from textwrap import dedent
+
+import pytest
+
+from year_2023.day_2.generate import generate_lines
+from year_2023.day_2.star_1.algo import parse_line
+from year_2023.day_2.tokenizer import (
+    iter_maxima,
+    parse_grabs,
+    parse_maxima,
+    read_maxima,
+)
+
+TEST_DATA = dedent(
+    """\
+    Game 1: 3 blue, 4 red; 1 red, 2 green, 6 blue; 2 green
+    Game 2: 1 blue, 2 green; 3 green, 4 blue, 1 red; 1 green, 1 blue
+    Game 100: 8 green, 6 blue, 20 red; 5 blue, 4 red, 13 green; 5 green, 1 red
+    """
+)
+
+
+def test_parse_grabs():
+    ids, game_starts, cubes = parse_grabs(TEST_DATA.encode())
+
+    assert ids.tolist() == [1, 2, 100]
+    assert game_starts.tolist() == [0, 3, 6]
+    assert cubes.tolist() == [
+        [4, 0, 3],
+        [1, 2, 6],
+        [0, 2, 0],
+        [0, 2, 1],
+        [1, 3, 4],
+        [0, 1, 1],
+        [20, 8, 6],
+        [4, 13, 5],
+        [1, 5, 0],
+    ]
+
+
+def test_parse_maxima():
+    ids, maxima = parse_maxima(TEST_DATA.encode())
+
+    assert ids.tolist() == [1, 2, 100]
+    assert maxima.tolist() == [[4, 2, 6], [1, 3, 4], [20, 13, 6]]
+    assert parse_maxima(b"")[1].shape == (0, 3)
+
+
+@pytest.mark.parametrize("batch_size", [1, 7, 1000])
+def test_iter_maxima(batch_size):
+    lines = "".join(generate_lines(100, seed=1)).splitlines()
+    expected = [
+        [game_number, *map(max, zip(*grabs))]
+        for game_number, grabs in map(parse_line, lines)
+    ]
+
+    parts = list(iter_maxima(iter(lines), batch_size))
+
+    assert len(parts) == -(-len(lines) // batch_size)
+    assert [
+        [game_id, *game_maxima]
+        for ids, maxima in parts
+        for game_id, game_maxima in zip(ids.tolist(), maxima.tolist())
+    ] == expected
+
+
+def test_read_maxima(tmp_path):
+    input_file = tmp_path / "input.txt"
+    input_file.write_text(TEST_DATA.rstrip())
+
+    parts = list(read_maxima(input_file, chunk_size=10))
+
+    assert [ids.tolist() for ids, _ in parts] == [[1], [2], [100]]
+    assert [maxima.tolist() for _, maxima in parts] == [
+        [[4, 2, 6]],
+        [[1, 3, 4]],
+        [[20, 13, 6]],
+    ]
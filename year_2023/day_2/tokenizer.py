@@ -0,0 +1,113 @@
+"""
+Tokenizer of game records ("Game 3: 8 green, 6 blue; 5 blue, 4 red") working on
+the bytes of many records at once with array operations, no Python code runs per game
+or per cube:
+
+- every run of digits is a number, its value is computed digit position by digit
+  position,
+- a number followed by ":" is a game id, otherwise the letter after the space is its
+  color,
+- ":" and ";" start grabs, so the grab of a cube is the last of them before it.
+
+Only arrays come out: per-grab (red, green, blue) triples or just per-game maxima.
+"""
+import mmap
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+from commons import get_chunks, get_run_values
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# arrays of a chunk stay in CPU caches, bigger chunks are slower
+CHUNK_SIZE = 2**20
+# lines of `str` data tokenized at once
+BATCH_SIZE = 2**13
+
+
+def _tokenize(data) -> tuple["np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray"]:
+    """
+    game ids, start of every game in grabs, (grabs x 3) cubes and start of every grab
+    in `data`
+    """
+    import numpy as np
+
+    # a newline at the end, so the byte after a number always exists
+    chars = np.frombuffer(data, dtype=np.uint8)
+    chars = np.concatenate((chars, np.frombuffer(b"\n\n", dtype=np.uint8)))
+
+    is_digit = ((chars >= ord("0")) & (chars <= ord("9"))).view(np.int8)
+    edges = np.diff(is_digit, prepend=np.int8(0))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+
+    lengths = ends - starts
+    values = get_run_values(chars, starts, lengths)
+
+    is_id = chars[ends] == ord(":")
+    grab_starts = np.flatnonzero((chars == ord(":")) | (chars == ord(";")))
+    game_starts = np.searchsorted(grab_starts, starts[is_id])
+
+    cubes = np.zeros((len(grab_starts), 3), dtype=np.int64)
+    is_cube = ~is_id
+    grabs = np.searchsorted(grab_starts, starts[is_cube]) - 1
+    # "r", "g" or "b" after "<number> "
+    colors = np.searchsorted(
+        np.array([ord("b"), ord("g"), ord("r")]), chars[ends[is_cube] + 1]
+    )
+    cubes[grabs, 2 - colors] = values[is_cube]
+
+    return values[is_id], game_starts, cubes, grab_starts
+
+
+def parse_grabs(data) -> tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """
+    `data` - bytes-like with whole records. Game ids, index of the first grab of every
+    game and (grabs x 3) red, green and blue cubes of every grab.
+    """
+    ids, game_starts, cubes, _ = _tokenize(data)
+    return ids, game_starts, cubes
+
+
+def parse_maxima(data) -> tuple["np.ndarray", "np.ndarray"]:
+    """game ids and (games x 3) maximum red, green and blue cubes of every game"""
+    import numpy as np
+
+    ids, game_starts, cubes, _ = _tokenize(data)
+    if len(ids) == 0:
+        return ids, np.zeros((0, 3), dtype=np.int64)
+    return ids, np.maximum.reduceat(cubes, game_starts)
+
+
+def iter_maxima(
+    data: str | bytes | Iterable[str], batch_size: int = BATCH_SIZE
+) -> Iterator[tuple["np.ndarray", "np.ndarray"]]:
+    """`parse_maxima` of chunks of text or of batches of `batch_size` lines"""
+    if isinstance(data, (str, bytes)):
+        data = data.encode() if isinstance(data, str) else data
+        for start, end in get_chunks(data, CHUNK_SIZE):
+            yield parse_maxima(data[start:end])
+        return
+
+    batch: list[str] = []
+    for line in data:
+        batch.append(line)
+        if len(batch) == batch_size:
+            yield parse_maxima("\n".join(batch).encode())
+            batch = []
+    if batch:
+        yield parse_maxima("\n".join(batch).encode())
+
+
+def read_maxima(
+    path: Path, chunk_size: int = CHUNK_SIZE
+) -> Iterator[tuple["np.ndarray", "np.ndarray"]]:
+    """`parse_maxima` of chunks of about `chunk_size` bytes of the memory-mapped file"""
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for start, end in get_chunks(mm, chunk_size):
+                yield parse_maxima(mm[start:end])
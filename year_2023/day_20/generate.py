@@ -0,0 +1,59 @@
+import random
+import string
+from typing import Iterator
+
+SIZES = [50, 100, 200, 400]
+SCALE = 5000
+
+SINK = "rx"
+
+
+def _get_names(rng: random.Random, count: int) -> list[str]:
+    length = 2
+    while 26**length <= count + 1:
+        length += 1
+
+    names = []
+    for i in rng.sample(range(26**length), count + 1):
+        name = ""
+        for _ in range(length):
+            i, char = divmod(i, 26)
+            name += string.ascii_lowercase[char]
+        if name != SINK:
+            names.append(name)
+    return names[:count]
+
+
+def generate_lines(size: int, seed: int = 0, chain_length: int = 12) -> Iterator[str]:
+    """
+    `size` - number of modules. Same shape as the real puzzle input: the broadcaster
+    starts chains of flip-flops, each chain is a counter with its own conjunction hub,
+    hubs go through inverters to one conjunction which sends to `rx`.
+    """
+    rng = random.Random(seed)
+    chains = max(1, (size - 2) // (chain_length + 2))
+    names = iter(_get_names(rng, chains * (chain_length + 2) + 1))
+    final = next(names)
+
+    modules: dict[str, list[str]] = {}
+    starts = []
+    for _ in range(chains):
+        flip_flops = [next(names) for _ in range(chain_length)]
+        hub, inverter = next(names), next(names)
+        starts.append(flip_flops[0])
+
+        modules["&" + hub] = [flip_flops[0], inverter]
+        for i, flip_flop in enumerate(flip_flops):
+            modules["%" + flip_flop] = flip_flops[i + 1 : i + 2]
+            if i in [0, chain_length - 1] or rng.random() < 0.5:
+                modules["%" + flip_flop].append(hub)
+            else:
+                modules["&" + hub].append(flip_flop)
+        modules["&" + inverter] = [final]
+
+    modules["broadcaster"] = starts
+    modules["&" + final] = [SINK]
+
+    lines = [f"{name} -> {', '.join(outputs)}\n" for name, outputs in modules.items()]
+    rng.shuffle(lines)
+    yield from lines
@@ -155,6 +155,8 @@ from enum import Enum, auto
 from pathlib import Path
 from typing import Any
 
+from commons import span
+
 CUR_DIR = Path(__file__).parent.resolve()
 input_data_file = CUR_DIR / "input.txt"
 
@@ -224,8 +226,10 @@ def build_instructions(parsed_instructions: ParsedInstructions) -> dict[str, Ins
 
 def algo(text: str) -> tuple[int, int]:
     # signal: False - low, True - high
-    instructions = parse(text)
-    instructions = build_instructions(instructions)
+    with span("parse"):
+        instructions = parse(text)
+    with span("build_instructions"):
+        instructions = build_instructions(instructions)
 
     def _update_definition(in_signal: bool, out_names: list[str]):
         for out_name in out_names:
@@ -0,0 +1,98 @@
+"""
+Everything about the numbers and symbols of a schematic in one pass over its rows,
+with the symbols taken from the schematic itself.
+
+Like `stream`, a window of three parsed rows closes a row once the rows around it are
+known. Any character that is not a digit, "." or whitespace is a symbol (as in
+`star_1.algo.get_symbols`), so both stars and the statistics of other symbols come
+from one traversal:
+
+- the sum of the part numbers (star 1),
+- the numbers next to every kind of symbol,
+- sums of the products of the numbers next to a symbol, by symbol and by the number of
+  numbers, the sum of gear ratios (star 2) is the one of "*" with two numbers.
+
+    python -m year_2023.day_3.engine schematic.txt
+"""
+import re
+import sys
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from math import prod
+from pathlib import Path
+from typing import Iterable
+
+from commons import iter_lines
+from year_2023.day_3.grid import GEAR
+from year_2023.day_3.stream import NUMBER, Row
+
+SYMBOL = re.compile(r"[^\d.\s]")
+
+
+@dataclass
+class SymbolRow(Row):
+    # symbol in every column of `symbols`
+    kinds: str = ""
+
+
+@dataclass
+class Report:
+    rows: int = 0
+    symbols: set[str] = field(default_factory=set)
+    part_sum: int = 0
+    # numbers next to a symbol, per symbol
+    adjacency: Counter[str] = field(default_factory=Counter)
+    # sums of products of the numbers next to a symbol, per (symbol, number of numbers)
+    ratio_sums: Counter[tuple[str, int]] = field(default_factory=Counter)
+
+    def get_ratio_sum(self, symbol: str = GEAR, arity: int = 2) -> int:
+        return self.ratio_sums[symbol, arity]
+
+
+def parse(line: str) -> SymbolRow:
+    symbols = list(SYMBOL.finditer(line))
+    return SymbolRow(
+        [(m.start(), m.end(), int(m.group())) for m in NUMBER.finditer(line)],
+        [m.start() for m in symbols],
+        kinds="".join(m.group() for m in symbols),
+    )
+
+
+def close_row(report: Report, above: SymbolRow, row: SymbolRow, below: SymbolRow):
+    """adds the numbers and symbols of `row` to `report`"""
+    window = (above, row, below)
+    report.rows += 1
+    report.symbols.update(row.kinds)
+
+    report.part_sum += sum(
+        value
+        for start, end, value in row.numbers
+        if any(neighbour.has_symbol(start - 1, end) for neighbour in window)
+    )
+
+    for column, kind in zip(row.symbols, row.kinds):
+        values = [value for other in window for value in other.get_numbers(column)]
+        if values:
+            report.adjacency[kind] += len(values)
+            report.ratio_sums[kind, len(values)] += prod(values)
+
+
+def run(lines: str | Iterable[str]) -> Report:
+    if isinstance(lines, str):
+        lines = lines.splitlines()
+
+    report = Report()
+    # an empty row above the first one and below the last one
+    window = deque([SymbolRow()], maxlen=3)
+    for line in lines:
+        window.append(parse(line))
+        if len(window) == 3:
+            close_row(report, *window)
+    if len(window) > 1:
+        window.append(SymbolRow())
+        close_row(report, *window)
+    return report
+
+
+if __name__ == "__main__":
+    print(run(iter_lines(Path(sys.argv[1]))))
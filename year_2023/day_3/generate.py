@@ -0,0 +1,35 @@
+import random
+from typing import Iterator
+
+from year_2023.day_3.star_1.algo import SYMBOLS
+
+SIZES = [50, 100, 200, 400]
+SCALE = 10**4
+
+
+def generate_lines(
+    size: int,
+    seed: int = 0,
+    number_probability: float = 0.15,
+    symbol_probability: float = 0.05,
+) -> Iterator[str]:
+    """
+    `size` - width and height of the schematic, numbers have 1 to 3 digits and are
+    separated by at least one "." from the next number.
+    """
+    rng = random.Random(seed)
+
+    for _ in range(size):
+        row = []
+        length = 0
+        while length < size:
+            r = rng.random()
+            if r < number_probability:
+                token = str(rng.randint(1, 999)) + "."
+            elif r < number_probability + symbol_probability:
+                token = rng.choice(SYMBOLS)
+            else:
+                token = "."
+            row.append(token)
+            length += len(token)
+        yield "".join(row)[:size] + "\n"
@@ -0,0 +1,122 @@
+"""
+The engine schematic as a 2D `uint8` array, both stars with array operations and no
+Python code per cell:
+
+- cells next to a symbol are the symbols dilated by one cell in all 8 directions,
+- runs of digits are labelled in row-major order, a row ends with a non-digit so runs
+  don't continue on the next row, their values are computed digit position by digit
+  position,
+- a number is a part number iff any of its cells is next to a symbol,
+- the labels around every gear symbol are sorted per symbol, so its distinct numbers
+  are the labels that differ from their left neighbour.
+"""
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from commons import get_run_values
+from year_2023.day_3.star_1.algo import SYMBOLS
+
+if TYPE_CHECKING:
+    import numpy as np
+
+GEAR = "*"
+# (row, column) offsets of the 8 neighbours of a cell
+NEIGHBOURS = [(dy, dx) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dy or dx]
+
+
+def load_grid(text: str | bytes) -> "np.ndarray":
+    """(rows x columns) `uint8` array, shorter rows are padded with "." """
+    import numpy as np
+
+    data = text.encode() if isinstance(text, str) else text
+    rows = data.splitlines()
+    width = max(map(len, rows), default=0)
+    grid = np.frombuffer(b"".join(row.ljust(width, b".") for row in rows), np.uint8)
+    return grid.reshape(len(rows), width)
+
+
+def get_mask(grid: "np.ndarray", symbols: str) -> "np.ndarray":
+    import numpy as np
+
+    return np.isin(grid, np.frombuffer(symbols.encode(), dtype=np.uint8))
+
+
+def dilate(mask: "np.ndarray") -> "np.ndarray":
+    """cells of `mask` and their 8 neighbours"""
+    import numpy as np
+
+    padded = np.pad(mask, 1)
+    height, width = mask.shape
+    result = np.zeros_like(mask)
+    for dy in (0, 1, 2):
+        for dx in (0, 1, 2):
+            result |= padded[dy : dy + height, dx : dx + width]
+    return result
+
+
+@dataclass
+class Numbers:
+    # label of the number of every cell, -1 for cells without a digit
+    labels: "np.ndarray"
+    # value of every label
+    values: "np.ndarray"
+
+    @classmethod
+    def from_grid(cls, grid: "np.ndarray") -> "Numbers":
+        import numpy as np
+
+        height, width = grid.shape
+        is_digit = (grid >= ord("0")) & (grid <= ord("9"))
+        # a non-digit column at the end of every row
+        chars = np.pad(grid, ((0, 0), (0, 1)), constant_values=ord(".")).ravel()
+        flat_digit = np.pad(is_digit, ((0, 0), (0, 1))).ravel()
+
+        edges = np.diff(flat_digit.view(np.int8), prepend=np.int8(0))
+        starts = np.flatnonzero(edges == 1)
+        lengths = np.flatnonzero(edges == -1) - starts
+
+        values = get_run_values(chars, starts, lengths)
+
+        labels = np.cumsum(edges == 1, dtype=np.int32) - 1
+        labels[~flat_digit] = -1
+        return cls(labels.reshape(height, width + 1)[:, :width], values)
+
+    def get_neighbours(self, mask: "np.ndarray") -> "np.ndarray":
+        """(cells of `mask` x 8) labels around them, -1 outside of the grid"""
+        import numpy as np
+
+        ys, xs = np.nonzero(mask)
+        padded = np.pad(self.labels, 1, constant_values=-1)
+        return np.stack(
+            [padded[ys + 1 + dy, xs + 1 + dx] for dy, dx in NEIGHBOURS], axis=1
+        )
+
+
+def get_part_numbers(
+    grid: "np.ndarray", numbers: Numbers, symbols: str = SYMBOLS
+) -> "np.ndarray":
+    """values of the numbers next to a symbol, in row-major order"""
+    import numpy as np
+
+    near_symbol = dilate(get_mask(grid, symbols)) & (numbers.labels >= 0)
+    is_part = np.zeros(len(numbers.values), dtype=bool)
+    is_part[numbers.labels[near_symbol]] = True
+    return numbers.values[is_part]
+
+
+def get_gear_ratios(
+    grid: "np.ndarray", numbers: Numbers, gear: str = GEAR
+) -> "np.ndarray":
+    """products of the two numbers of the gear symbols next to exactly two numbers"""
+    import numpy as np
+
+    labels = np.sort(numbers.get_neighbours(get_mask(grid, gear)), axis=1)
+    is_new = np.ones_like(labels, dtype=bool)
+    is_new[:, 1:] = labels[:, 1:] != labels[:, :-1]
+    counts = (is_new & (labels >= 0)).sum(axis=1)
+
+    gears = labels[counts == 2]
+    # the two distinct labels are the largest one and the largest of the others
+    last = gears[:, -1]
+    first = np.where(gears == last[:, None], -1, gears).max(axis=1)
+    return numbers.values[first] * numbers.values[last]
@@ -0,0 +1,161 @@
+"""
+A schematic that can be edited cell by cell, with the sum of part numbers (star 1) and
+of gear ratios (star 2) kept up to date without a scan of the whole grid.
+
+An edit of a cell changes only the numbers next to it, that is in its 3 x 3 square,
+and the gears next to the digits around it in its row (a digit may join or split
+numbers). Their part numbers and gear ratios are taken out of the sums, the cell is
+changed, the numbers of the digits around it are indexed again and the part numbers
+and gear ratios are added back. An edit costs the length of the numbers around it,
+not the size of the grid. Symbols are as in `engine`, any character that is not a
+digit, "." or whitespace.
+
+    python -m year_2023.day_3.schematic 2000
+"""
+import re
+import sys
+import time
+from itertools import product
+
+from year_2023.day_3.engine import SYMBOL
+from year_2023.day_3.grid import GEAR
+from year_2023.day_3.stream import NUMBER
+
+DIGITS = frozenset("0123456789")
+
+
+class Schematic:
+    def __init__(self, text: str, gear: str = GEAR):
+        rows = text.splitlines()
+        self.width = max(map(len, rows), default=0)
+        self.height = len(rows)
+        self.gear = gear
+        self.cells = [list(row.ljust(self.width, ".")) for row in rows]
+        # start column of the number of every cell, -1 for cells without a digit
+        self.starts = [[-1] * self.width for _ in rows]
+        # (row, start) of every number -> (end, value), end is exclusive
+        self.numbers: dict[tuple[int, int], tuple[int, int]] = {}
+
+        for y in range(self.height):
+            self._index(y, 0, self.width - 1)
+        self.part_sum = sum(
+            self.numbers[number][1] for number in self.numbers if self._is_part(number)
+        )
+        self.gear_ratio_sum = sum(
+            self._get_ratio(y, match.start())
+            for y, row in enumerate(rows)
+            for match in re.finditer(re.escape(gear), row)
+        )
+
+    def __str__(self) -> str:
+        return "".join("".join(row) + "\n" for row in self.cells)
+
+    def __getitem__(self, cell: tuple[int, int]) -> str:
+        y, x = cell
+        return self.cells[y][x]
+
+    def __setitem__(self, cell: tuple[int, int], char: str):
+        y, x = cell
+        if not (0 <= y < self.height and 0 <= x < self.width):
+            raise IndexError(f"{cell} is outside of the schematic")
+        if len(char) != 1 or char == "\n":
+            raise ValueError(f"{char!r} isn't a single character")
+
+        # the digits around the cell, their numbers may change
+        row = self.cells[y]
+        left = x
+        while left > 0 and row[left - 1] in DIGITS:
+            left -= 1
+        right = x
+        while right < self.width - 1 and row[right + 1] in DIGITS:
+            right += 1
+
+        self._add(y, x, left, right, -1)
+        row[x] = char
+        self._index(y, left, right)
+        self._add(y, x, left, right, 1)
+
+    def _add(self, y: int, x: int, left: int, right: int, sign: int):
+        """adds (or takes out) the part numbers and gear ratios an edit can change"""
+        self.part_sum += sign * sum(
+            self.numbers[number][1]
+            for number in self._get_numbers(y, x)
+            if self._is_part(number)
+        )
+        self.gear_ratio_sum += sign * sum(
+            self._get_ratio(gear_y, gear_x)
+            for gear_y, gear_x in product(
+                range(max(0, y - 1), min(self.height, y + 2)),
+                range(max(0, left - 1), min(self.width, right + 2)),
+            )
+            if self.cells[gear_y][gear_x] == self.gear
+        )
+
+    def _index(self, y: int, left: int, right: int):
+        """numbers of the row from `left` to `right`, with no digits right outside"""
+        row, starts = self.cells[y], self.starts[y]
+        for x in range(left, right + 1):
+            if starts[x] == x:
+                del self.numbers[y, x]
+            starts[x] = -1
+
+        for match in NUMBER.finditer("".join(row[left : right + 1])):
+            start, end = left + match.start(), left + match.end()
+            starts[start:end] = [start] * (end - start)
+            self.numbers[y, start] = (end, int(match.group()))
+
+    def _get_numbers(self, y: int, x: int) -> set[tuple[int, int]]:
+        """(row, start) of the numbers next to the cell or in it"""
+        return {
+            (number_y, self.starts[number_y][number_x])
+            for number_y in range(max(0, y - 1), min(self.height, y + 2))
+            for number_x in range(max(0, x - 1), min(self.width, x + 2))
+            if self.starts[number_y][number_x] != -1
+        }
+
+    def _is_part(self, number: tuple[int, int]) -> bool:
+        y, start = number
+        end, _ = self.numbers[number]
+        return any(
+            SYMBOL.search("".join(self.cells[symbol_y][max(0, start - 1) : end + 1]))
+            for symbol_y in range(max(0, y - 1), min(self.height, y + 2))
+        )
+
+    def _get_ratio(self, y: int, x: int) -> int:
+        numbers = self._get_numbers(y, x)
+        if len(numbers) != 2:
+            return 0
+        first, second = numbers
+        return self.numbers[first][1] * self.numbers[second][1]
+
+
+def _bench(size: int, edits: int = 10000, seed: int = 0):
+    """latency of an edit against a scan of the whole schematic by `engine`"""
+    import random
+
+    from year_2023.day_3.engine import run
+    from year_2023.day_3.generate import generate_lines
+
+    text = "".join(generate_lines(size, seed))
+    rng = random.Random(seed)
+    chars = "0123456789.*#"
+
+    start = time.perf_counter()
+    schematic = Schematic(text)
+    print(f"{'Schematic':<24} {(time.perf_counter() - start) * 1e6:12.1f}µs")
+
+    start = time.perf_counter()
+    for _ in range(edits):
+        schematic[rng.randrange(size), rng.randrange(size)] = rng.choice(chars)
+    print(f"{'edit':<24} {(time.perf_counter() - start) / edits * 1e6:12.1f}µs")
+
+    start = time.perf_counter()
+    report = run(str(schematic))
+    print(f"{'engine.run':<24} {(time.perf_counter() - start) * 1e6:12.1f}µs")
+
+    assert schematic.part_sum == report.part_sum
+    assert schematic.gear_ratio_sum == report.get_ratio_sum(GEAR, 2)
+
+
+if __name__ == "__main__":
+    _bench(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -93,6 +93,10 @@ def algo(data: str) -> list[int]:
     return result
 
 
+def solve(text: str) -> int:
+    return sum(algo(text))
+
+
 if __name__ == "__main__":
     text = input_data_file.read_text()
     # symbols = get_symbols(text)
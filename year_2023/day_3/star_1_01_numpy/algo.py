@@ -0,0 +1,20 @@
+from pathlib import Path
+
+from year_2023.day_3.grid import Numbers, get_part_numbers, load_grid
+
+CUR_DIR = Path(__file__).parent.resolve()
+input_data_file = CUR_DIR / "input.txt"
+
+
+def algo(data: str) -> list[int]:
+    grid = load_grid(data)
+    return get_part_numbers(grid, Numbers.from_grid(grid)).tolist()
+
+
+def solve(text: str) -> int:
+    grid = load_grid(text)
+    return int(get_part_numbers(grid, Numbers.from_grid(grid)).sum())
+
+
+if __name__ == "__main__":
+    print("sum:", solve(input_data_file.read_text()))
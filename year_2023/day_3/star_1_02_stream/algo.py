@@ -0,0 +1,18 @@
+from pathlib import Path
+from typing import Iterable
+
+from commons import iter_lines
+from year_2023.day_3.stream import stream
+
+CUR_DIR = Path(__file__).parent.resolve()
+input_data_file = CUR_DIR / "input.txt"
+
+LINES_INPUT = True
+
+
+def solve(data: str | Iterable[str]) -> int:
+    return stream(data).part_sum
+
+
+if __name__ == "__main__":
+    print("sum:", solve(iter_lines(input_data_file)))
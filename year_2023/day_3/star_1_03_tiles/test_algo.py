@@ -0,0 +1,26 @@
+from textwrap import dedent
+
+from .algo import solve
+
+
+def test_solve(tmp_path):
+    input_file = tmp_path / "input.txt"
+    input_file.write_text(
+        dedent(
+            """\
+            467..114..
+            ...*......
+            ..35..633.
+            ......#...
+            617*......
+            .....+.58.
+            ..592.....
+            ......755.
+            ...$.*....
+            .664.598..
+            """
+        )
+    )
+
+    assert solve(input_file) == 4361
+    assert solve(input_file, processes=2) == 4361
@@ -26,6 +26,8 @@ adjacent to one part number.) Adding up all of the gear ratios produces 467835.
 
 What is the sum of all of the gear ratios in your engine schematic?
 """
+import re
+from bisect import bisect_left
 from pathlib import Path
 
 CUR_DIR = Path(__file__).parent.resolve()
@@ -33,69 +35,53 @@ input_data_file = CUR_DIR / "input.txt"
 
 
 SYMBOLS = "*"
-
-
-def _get_number(data: list[str], cord: tuple[int, int]) -> str:
-    digits = []
-    for char in data[cord[0]][cord[1] :]:
-        if char.isdigit():
-            digits.append(char)
-        else:
-            break
-    return "".join(digits)
+NUMBER = re.compile(r"\d+")
+
+
+def get_index(
+    data: str, symbols: str = SYMBOLS
+) -> tuple[list[tuple[int, int, int, int]], dict[int, list[int]]]:
+    """
+    One pass over the schematic: (row, start, end, value) of every number, end is
+    exclusive, and the sorted columns of the symbols of every row with any
+    """
+    symbol = re.compile(f"[{re.escape(symbols)}]")
+    spans = []
+    symbol_columns = {}
+    for y, line in enumerate(data.splitlines()):
+        spans += [
+            (y, m.start(), m.end(), int(m.group())) for m in NUMBER.finditer(line)
+        ]
+        if columns := [m.start() for m in symbol.finditer(line)]:
+            symbol_columns[y] = columns
+    return spans, symbol_columns
 
 
 def algo(data: str) -> list[int]:
-    data = data.splitlines()
-    max_x = len(data[0])
-    max_y = len(data)
-
-    y = 0
-    asterisk_to_numbers: dict[tuple[int, int], set[tuple[int, int]]] = {}
-
-    while y < max_y:
-        number_index: int = -1
-        x = 0
-
-        while x < max_x:
-            if data[y][x].isdigit():
-                if number_index == -1:
-                    number_index = x
-
-                for _cord in [
-                    [-1, -1],
-                    [-1, 0],
-                    [-1, 1],
-                    [0, -1],
-                    [0, 1],
-                    [1, -1],
-                    [1, 0],
-                    [1, 1],
-                ]:
-                    cord = y + _cord[0], x + _cord[1]
-                    if -1 in cord or cord[0] >= max_y or cord[1] >= max_x:
-                        continue
-                    if data[cord[0]][cord[1]] in SYMBOLS:
-                        asterisk_to_numbers.setdefault(cord, set()).add(
-                            (y, number_index)
-                        )
-                        break
-            else:
-                number_index = -1
-
-            x += 1
-
-        y += 1
-
-    result = []
-    for numbers_cords in asterisk_to_numbers.values():
-        if len(numbers_cords) == 2:
-            result.append(
-                int(_get_number(data, numbers_cords.pop()))
-                * int(_get_number(data, numbers_cords.pop()))
-            )
-
-    return result
+    """
+    Every number looks up the symbols of its row and of the rows next to it, so the
+    work grows with the numbers and not with their digits.
+    """
+    spans, symbol_columns = get_index(data)
+
+    symbol_to_numbers: dict[tuple[int, int], list[int]] = {}
+    for y, start, end, value in spans:
+        for row in (y - 1, y, y + 1):
+            columns = symbol_columns.get(row, [])
+            i = bisect_left(columns, start - 1)
+            while i < len(columns) and columns[i] <= end:
+                symbol_to_numbers.setdefault((row, columns[i]), []).append(value)
+                i += 1
+
+    return [
+        numbers[0] * numbers[1]
+        for numbers in symbol_to_numbers.values()
+        if len(numbers) == 2
+    ]
+
+
+def solve(text: str) -> int:
+    return sum(algo(text))
 
 
 def main():
@@ -1,6 +1,6 @@
 from textwrap import dedent
 
-from .algo import algo
+from .algo import algo, get_index
 
 
 def test_algo():
@@ -23,3 +23,15 @@ def test_algo():
         )
         == [16345, 451490]
     )
+
+
+def test_get_index():
+    assert get_index("467..*\n..*35.\n") == (
+        [(0, 0, 3, 467), (1, 3, 5, 35)],
+        {0: [5], 1: [2]},
+    )
+
+
+def test_algo_number_next_to_two_gears():
+    # 2 and 3 are next to both gears
+    assert algo("2*.\n.*3\n") == [6, 6]
@@ -0,0 +1,84 @@
+from pathlib import Path
+
+CUR_DIR = Path(__file__).parent.resolve()
+input_data_file = CUR_DIR / "input.txt"
+
+
+SYMBOLS = "*"
+
+
+def _get_number(data: list[str], cord: tuple[int, int]) -> str:
+    digits = []
+    for char in data[cord[0]][cord[1] :]:
+        if char.isdigit():
+            digits.append(char)
+        else:
+            break
+    return "".join(digits)
+
+
+def algo(data: str) -> list[int]:
+    data = data.splitlines()
+    max_x = len(data[0])
+    max_y = len(data)
+
+    y = 0
+    asterisk_to_numbers: dict[tuple[int, int], set[tuple[int, int]]] = {}
+
+    while y < max_y:
+        number_index: int = -1
+        x = 0
+
+        while x < max_x:
+            if data[y][x].isdigit():
+                if number_index == -1:
+                    number_index = x
+
+                for _cord in [
+                    [-1, -1],
+                    [-1, 0],
+                    [-1, 1],
+                    [0, -1],
+                    [0, 1],
+                    [1, -1],
+                    [1, 0],
+                    [1, 1],
+                ]:
+                    cord = y + _cord[0], x + _cord[1]
+                    if -1 in cord or cord[0] >= max_y or cord[1] >= max_x:
+                        continue
+                    if data[cord[0]][cord[1]] in SYMBOLS:
+                        asterisk_to_numbers.setdefault(cord, set()).add(
+                            (y, number_index)
+                        )
+            else:
+                number_index = -1
+
+            x += 1
+
+        y += 1
+
+    result = []
+    for numbers_cords in asterisk_to_numbers.values():
+        if len(numbers_cords) == 2:
+            result.append(
+                int(_get_number(data, numbers_cords.pop()))
+                * int(_get_number(data, numbers_cords.pop()))
+            )
+
+    return result
+
+
+def solve(text: str) -> int:
+    return sum(algo(text))
+
+
+def main():
+    text = input_data_file.read_text()
+    result = algo(text)
+    print(result)
+    print("sum:", sum(result))
+
+
+if __name__ == "__main__":
+    main()
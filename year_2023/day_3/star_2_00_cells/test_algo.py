@@ -0,0 +1,30 @@
+from textwrap import dedent
+
+from .algo import algo
+
+
+def test_algo():
+    assert (
+        algo(
+            dedent(
+                """\
+                467..114..
+                ...*......
+                ..35..633.
+                ......#...
+                617*......
+                .....+.58.
+                ..592.....
+                ......755.
+                ...$.*....
+                .664.598..
+                """
+            ),
+        )
+        == [16345, 451490]
+    )
+
+
+def test_algo_number_next_to_two_gears():
+    # 2 and 3 are next to both gears
+    assert algo("2*.\n.*3\n") == [6, 6]
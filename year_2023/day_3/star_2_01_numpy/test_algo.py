@@ -0,0 +1,26 @@
+from textwrap import dedent
+
+from .algo import algo, solve
+
+TEXT = dedent(
+    """\
+    467..114..
+    ...*......
+    ..35..633.
+    ......#...
+    617*......
+    .....+.58.
+    ..592.....
+    ......755.
+    ...$.*....
+    .664.598..
+    """
+)
+
+
+def test_algo():
+    assert algo(TEXT) == [16345, 451490]
+
+
+def test_solve():
+    assert solve(TEXT) == 467835
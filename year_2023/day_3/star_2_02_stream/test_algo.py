@@ -0,0 +1,23 @@
+from textwrap import dedent
+
+from .algo import solve
+
+TEXT = dedent(
+    """\
+    467..114..
+    ...*......
+    ..35..633.
+    ......#...
+    617*......
+    .....+.58.
+    ..592.....
+    ......755.
+    ...$.*....
+    .664.598..
+    """
+)
+
+
+def test_solve():
+    assert solve(TEXT) == 467835
+    assert solve(iter(TEXT.splitlines())) == 467835
@@ -0,0 +1,127 @@
+"""
+Both stars of a schematic read row by row, memory grows with the width of the rows,
+not with their number.
+
+A number or a gear only touches the rows above and below it, so a window of three
+parsed rows is enough: when a row comes in, the row before it has both neighbours and
+its numbers and gears are closed and summed up. A row keeps only its number spans and
+the columns of its symbols and gears.
+
+    python -m year_2023.day_3.stream schematic.txt
+"""
+import re
+import sys
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable
+
+from commons import iter_lines
+from year_2023.day_3.grid import GEAR
+from year_2023.day_3.star_1.algo import SYMBOLS
+
+NUMBER = re.compile(r"\d+")
+
+
+@dataclass
+class Totals:
+    rows: int = 0
+    # star 1
+    part_sum: int = 0
+    # star 2
+    gear_ratio_sum: int = 0
+
+    def __add__(self, other: "Totals") -> "Totals":
+        return Totals(
+            self.rows + other.rows,
+            self.part_sum + other.part_sum,
+            self.gear_ratio_sum + other.gear_ratio_sum,
+        )
+
+
+@dataclass
+class Row:
+    # (start, end, value) of every number, end is exclusive
+    numbers: list[tuple[int, int, int]] = field(default_factory=list)
+    # sorted columns
+    symbols: list[int] = field(default_factory=list)
+    gears: list[int] = field(default_factory=list)
+
+    def has_symbol(self, start: int, end: int) -> bool:
+        """a symbol in columns `start` to `end`, both included"""
+        i = bisect_left(self.symbols, start)
+        return i < len(self.symbols) and self.symbols[i] <= end
+
+    def get_numbers(self, column: int) -> list[int]:
+        """values of the numbers next to `column`"""
+        i = bisect_left(self.numbers, column, key=lambda number: number[1])
+        result = []
+        for start, _, value in self.numbers[i:]:
+            if start > column + 1:
+                break
+            result.append(value)
+        return result
+
+
+class Parser:
+    def __init__(self, symbols: str = SYMBOLS, gear: str = GEAR):
+        self.symbols = re.compile(f"[{re.escape(symbols)}]")
+        self.gear = gear
+
+    def parse(self, line: str) -> Row:
+        return Row(
+            [(m.start(), m.end(), int(m.group())) for m in NUMBER.finditer(line)],
+            [m.start() for m in self.symbols.finditer(line)],
+            [m.start() for m in re.finditer(re.escape(self.gear), line)],
+        )
+
+
+def close_row(above: Row, row: Row, below: Row) -> Totals:
+    """sums of the numbers and the gears of `row`, once both its neighbours are known"""
+    window = (above, row, below)
+
+    part_sum = sum(
+        value
+        for start, end, value in row.numbers
+        if any(neighbour.has_symbol(start - 1, end) for neighbour in window)
+    )
+
+    gear_ratio_sum = 0
+    for column in row.gears:
+        values = [value for other in window for value in other.get_numbers(column)]
+        if len(values) == 2:
+            gear_ratio_sum += values[0] * values[1]
+
+    return Totals(1, part_sum, gear_ratio_sum)
+
+
+def stream(
+    lines: str | Iterable[str],
+    symbols: str = SYMBOLS,
+    gear: str = GEAR,
+    above: str = "",
+    below: str = "",
+) -> Totals:
+    """
+    `above` and `below` - rows around `lines`, only read for the numbers and gears of
+    `lines` (see `tiles`)
+    """
+    if isinstance(lines, str):
+        lines = lines.splitlines()
+    parser = Parser(symbols, gear)
+
+    totals = Totals()
+    window = deque([parser.parse(above)], maxlen=3)
+    for line in lines:
+        window.append(parser.parse(line))
+        if len(window) == 3:
+            totals += close_row(*window)
+    if len(window) > 1:
+        window.append(parser.parse(below))
+        totals += close_row(*window)
+    return totals
+
+
+if __name__ == "__main__":
+    print(stream(iter_lines(Path(sys.argv[1]))))
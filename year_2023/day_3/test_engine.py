@@ -0,0 +1,51 @@
+from collections import Counter
+
+import pytest
+
+from year_2023.day_3.generate import generate_lines
+from year_2023.day_3.star_1.algo import get_symbols
+
+from .engine import SymbolRow, parse, run
+from .stream import stream
+from .test_grid import EXAMPLE
+
+
+def test_parse():
+    assert parse("467..*114.~") == SymbolRow(
+        [(0, 3, 467), (6, 9, 114)], [5, 10], kinds="*~"
+    )
+
+
+def test_run():
+    report = run(EXAMPLE)
+
+    assert report.rows == 10
+    assert report.symbols == set("#$*+")
+    assert report.part_sum == 4361
+    assert report.adjacency == Counter({"*": 5, "#": 1, "+": 1, "$": 1})
+    assert report.ratio_sums == Counter(
+        {("*", 2): 467835, ("*", 1): 617, ("#", 1): 633, ("+", 1): 592, ("$", 1): 664}
+    )
+    assert report.get_ratio_sum() == 467835
+
+
+def test_run_any_symbol():
+    # "~" isn't in star_1.SYMBOLS, a gear with three numbers
+    report = run(["1.2", ".~.", "3*4", "..5"])
+
+    assert report.symbols == {"~", "*"}
+    assert report.part_sum == 15
+    assert report.get_ratio_sum("~", 4) == 24
+    assert report.get_ratio_sum("*", 3) == 60
+    assert report.get_ratio_sum("*", 2) == 0
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_run_generated(seed):
+    text = "".join(generate_lines(100, seed))
+    report = run(iter(text.splitlines()))
+    totals = stream(text)
+
+    assert report.symbols == set(get_symbols(text))
+    assert report.part_sum == totals.part_sum
+    assert report.get_ratio_sum() == totals.gear_ratio_sum
@@ -0,0 +1,77 @@
+from textwrap import dedent
+
+import pytest
+
+from year_2023.day_3.generate import generate_lines
+from year_2023.day_3.star_1.algo import algo as part_numbers
+from year_2023.day_3.star_2.algo import algo as gear_ratios
+
+from .grid import Numbers, dilate, get_gear_ratios, get_part_numbers, load_grid
+
+EXAMPLE = dedent(
+    """\
+    467..114..
+    ...*......
+    ..35..633.
+    ......#...
+    617*......
+    .....+.58.
+    ..592.....
+    ......755.
+    ...$.*....
+    .664.598..
+    """
+)
+
+
+def test_load_grid():
+    grid = load_grid("12\n#\n")
+    assert grid.shape == (2, 2)
+    assert bytes(grid.ravel()) == b"12#."
+
+
+def test_dilate():
+    grid = load_grid("....\n.#..\n....\n...#\n")
+    assert dilate(grid == ord("#")).astype(int).tolist() == [
+        [1, 1, 1, 0],
+        [1, 1, 1, 0],
+        [1, 1, 1, 1],
+        [0, 0, 1, 1],
+    ]
+
+
+def test_numbers():
+    numbers = Numbers.from_grid(load_grid("12.3\n4..5\n"))
+    assert numbers.labels.tolist() == [[0, 0, -1, 1], [2, -1, -1, 3]]
+    assert numbers.values.tolist() == [12, 3, 4, 5]
+
+
+def test_example():
+    grid = load_grid(EXAMPLE)
+    numbers = Numbers.from_grid(grid)
+    assert get_part_numbers(grid, numbers).tolist() == [
+        467,
+        35,
+        633,
+        617,
+        592,
+        755,
+        664,
+        598,
+    ]
+    assert get_gear_ratios(grid, numbers).tolist() == [16345, 451490]
+
+
+def test_gear_with_a_number_twice():
+    grid = load_grid("123\n.*.\n4..\n")
+    assert get_gear_ratios(grid, Numbers.from_grid(grid)).tolist() == [492]
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_generated(seed):
+    text = "".join(generate_lines(100, seed))
+    grid = load_grid(text)
+    numbers = Numbers.from_grid(grid)
+
+    assert get_part_numbers(grid, numbers).tolist() == part_numbers(text)
+    assert sorted(get_gear_ratios(grid, numbers).tolist()) == sorted(gear_ratios(text))
@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+from year_2023.day_3.generate import generate_lines
+
+from .engine import run
+from .schematic import Schematic
+from .test_grid import EXAMPLE
+
+
+def test_schematic():
+    schematic = Schematic(EXAMPLE)
+
+    assert str(schematic) == EXAMPLE
+    assert schematic.part_sum == 4361
+    assert schematic.gear_ratio_sum == 467835
+
+
+def test_edit():
+    schematic = Schematic("12.\n..*\n.3.\n")
+    assert (schematic.part_sum, schematic.gear_ratio_sum) == (15, 36)
+
+    # 12 becomes 124
+    schematic[0, 2] = "4"
+    assert schematic[0, 2] == "4"
+    assert (schematic.part_sum, schematic.gear_ratio_sum) == (127, 372)
+    # splits 124, 1 isn't a part number
+    schematic[0, 1] = "."
+    assert (schematic.part_sum, schematic.gear_ratio_sum) == (7, 12)
+    # no symbol left
+    schematic[1, 2] = "."
+    assert (schematic.part_sum, schematic.gear_ratio_sum) == (0, 0)
+
+
+def test_edit_outside():
+    schematic = Schematic("1.\n.*\n")
+    with pytest.raises(IndexError):
+        schematic[2, 0] = "."
+    with pytest.raises(ValueError):
+        schematic[0, 0] = "12"
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_edits(seed):
+    rng = random.Random(seed)
+    schematic = Schematic("".join(generate_lines(30, seed)))
+
+    for _ in range(300):
+        schematic[rng.randrange(30), rng.randrange(30)] = rng.choice("0123456789.*#")
+        report = run(str(schematic))
+        assert schematic.part_sum == report.part_sum
+        assert schematic.gear_ratio_sum == report.get_ratio_sum()
@@ -0,0 +1,49 @@
+import pytest
+
+from year_2023.day_3.generate import generate_lines
+from year_2023.day_3.star_1.algo import solve as solve_star_1
+from year_2023.day_3.star_2.algo import solve as solve_star_2
+
+from .stream import Parser, Row, Totals, stream
+from .test_grid import EXAMPLE
+
+
+def test_parser():
+    row = Parser().parse("467..*114.#")
+    assert row == Row([(0, 3, 467), (6, 9, 114)], [5, 10], [5])
+
+
+def test_row():
+    row = Row([(0, 3, 467), (6, 9, 114)], [5, 10])
+    assert row.has_symbol(3, 5)
+    assert not row.has_symbol(6, 9)
+    assert row.get_numbers(3) == [467]
+    assert row.get_numbers(5) == [114]
+    assert row.get_numbers(4) == []
+
+
+def test_stream():
+    assert stream(EXAMPLE) == Totals(10, 4361, 467835)
+
+
+@pytest.mark.parametrize(
+    "lines, totals",
+    [([], Totals()), (["1*2"], Totals(1, 3, 2)), (["1", "*", "2"], Totals(3, 3, 2))],
+)
+def test_stream_short(lines, totals):
+    assert stream(lines) == totals
+
+
+def test_stream_halos():
+    # only the numbers and gears of the middle row count
+    assert stream(["..*"], above="12.", below=".3.") == Totals(1, 0, 36)
+    assert stream(["12."], below="..*") == Totals(1, 12, 0)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_stream_generated(seed):
+    text = "".join(generate_lines(100, seed))
+    totals = stream(iter(text.splitlines()))
+
+    assert totals.part_sum == solve_star_1(text)
+    assert totals.gear_ratio_sum == solve_star_2(text)
@@ -0,0 +1,30 @@
+import pytest
+
+from year_2023.day_3.generate import generate_lines
+
+from .stream import Totals, stream
+from .tiles import get_halos, scan
+
+
+def test_get_halos():
+    data = b"ab\ncd\nef\ngh"
+    assert get_halos(data, 0, 3) == (b"", b"cd")
+    assert get_halos(data, 3, 9) == (b"ab", b"gh")
+    assert get_halos(data, 9, 11) == (b"ef", b"")
+
+
+def test_scan_across_tiles(tmp_path):
+    # a gear and a number on the edges of tiles of one row
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("12.\n..*\n.3.\n")
+
+    assert scan(input_file, processes=1, chunk_size=1) == stream(input_file.read_text())
+
+
+@pytest.mark.parametrize("chunk_size", [1, 1000, 2**22])
+def test_scan(tmp_path, chunk_size):
+    text = "".join(generate_lines(100, seed=1))
+    input_file = tmp_path / "input.txt"
+    input_file.write_text(text)
+
+    assert scan(input_file, processes=2, chunk_size=chunk_size) == stream(text)
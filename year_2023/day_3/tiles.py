@@ -0,0 +1,64 @@
+"""
+Both stars of a big schematic in tiles of rows scanned by a process pool.
+
+The memory-mapped file is cut into tiles of about `chunk_size` bytes of whole rows.
+A tile is streamed (see `stream`) with the row before it and the row after it as
+halos, which are only read and never summed up. A number lies in one row and every row
+is in exactly one tile, so numbers and gears across the edge of a tile are counted
+once, by the tile of their row, and the totals of the tiles just add up.
+
+    python -m year_2023.day_3.tiles schematic.txt
+"""
+import mmap
+import sys
+from functools import reduce
+from operator import add
+from pathlib import Path
+
+from commons import map_chunks
+from year_2023.day_3.grid import GEAR
+from year_2023.day_3.star_1.algo import SYMBOLS
+from year_2023.day_3.stream import Totals, stream
+
+CHUNK_SIZE = 2**22
+
+
+def get_halos(data, start: int, end: int) -> tuple[bytes, bytes]:
+    """rows before and after the whole rows from `start` to `end`, b"" at the edges"""
+    above = b""
+    if start > 0:
+        above = data[data.rfind(b"\n", 0, start - 1) + 1 : start - 1]
+    below_end = data.find(b"\n", end)
+    below = data[end : len(data) if below_end == -1 else below_end]
+    return above, below
+
+
+def _scan_tile(task: tuple[Path, int, int, str, str]) -> Totals:
+    path, start, end, symbols, gear = task
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        above, below = get_halos(mm, start, end)
+        return stream(
+            mm[start:end].decode(),
+            symbols,
+            gear,
+            above.decode().rstrip("\r"),
+            below.decode().rstrip("\r"),
+        )
+
+
+def scan(
+    path: Path,
+    symbols: str = SYMBOLS,
+    gear: str = GEAR,
+    processes: int | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> Totals:
+    return reduce(
+        add,
+        map_chunks(_scan_tile, path, (symbols, gear), processes, chunk_size),
+        Totals(),
+    )
+
+
+if __name__ == "__main__":
+    print(scan(Path(sys.argv[1])))
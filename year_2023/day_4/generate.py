@@ -0,0 +1,40 @@
+import random
+from typing import Iterator
+
+SIZES = [10**3, 10**4, 10**5, 10**6]
+SCALE = 10**6
+
+
+def generate_lines(
+    size: int,
+    seed: int = 0,
+    winning: int = 10,
+    numbers: int = 25,
+    match_probability: float = 0.07,
+) -> Iterator[str]:
+    """
+    `size` - number of cards. Each winning number matches with `match_probability`,
+    below 1 match per card on average the count of copies stays small. Won copies
+    never go past the end of the table.
+    """
+    rng = random.Random(seed)
+    width = len(str(size))
+
+    for card_number in range(1, size + 1):
+        winning_numbers = rng.sample(range(1, 100), winning)
+        other_numbers = [n for n in range(1, 100) if n not in winning_numbers]
+
+        matches = sum(rng.random() < match_probability for _ in range(winning))
+        matches = min(matches, size - card_number)
+        my_numbers = rng.sample(winning_numbers, matches) + rng.sample(
+            other_numbers, numbers - matches
+        )
+        rng.shuffle(my_numbers)
+
+        yield (
+            f"Card {card_number:>{width}}: "
+            + " ".join(f"{n:>2}" for n in winning_numbers)
+            + " | "
+            + " ".join(f"{n:>2}" for n in my_numbers)
+            + "\n"
+        )
@@ -34,15 +34,19 @@ Take a seat in the large pile of colorful cards. How many points are they worth
 total?
 """
 from pathlib import Path
+from typing import Iterable, Iterator
 
 CUR_DIR = Path(__file__).parent.resolve()
 input_data_file = CUR_DIR / "input.txt"
 
+LINES_INPUT = True
 
-def algo(data: str) -> list[int]:
-    result = []
 
-    for line in data.splitlines():
+def get_points(data: str | Iterable[str]) -> Iterator[int]:
+    if isinstance(data, str):
+        data = data.splitlines()
+
+    for line in data:
         winning_numbers, my_numbers = line.split("|")
 
         winning_numbers = winning_numbers.split()[2:]
@@ -53,9 +57,15 @@ def algo(data: str) -> list[int]:
             if my_number in winning_numbers:
                 points += points if points else 1
 
-        result.append(points)
+        yield points
+
+
+def algo(data: str | Iterable[str]) -> list[int]:
+    return list(get_points(data))
+
 
-    return result
+def solve(data: str | Iterable[str]) -> int:
+    return sum(get_points(data))
 
 
 def main():
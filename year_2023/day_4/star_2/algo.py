@@ -41,42 +41,54 @@ Process all of the original and copied scratchcards until no more scratchcards a
 Including the original set of scratchcards, how many total scratchcards do you end up
 with?
 """
+from collections import deque
 from pathlib import Path
+from typing import Iterable, Iterator
 
 CUR_DIR = Path(__file__).parent.resolve()
 input_data_file = CUR_DIR / "input.txt"
 
+LINES_INPUT = True
 
-def algo(data: str) -> list[int]:
-    cards = []
 
-    for line in data.splitlines():
+def get_card_counts(data: str | Iterable[str]) -> Iterator[int]:
+    """
+    Copies of every card, one by one. Won copies of the next cards wait in `pending`,
+    which is never longer than the winning numbers of a card.
+    """
+    if isinstance(data, str):
+        data = data.splitlines()
+
+    pending: deque[int] = deque()
+
+    for line in data:
         winning_numbers, my_numbers = line.split("|")
 
         winning_numbers = winning_numbers.split()[2:]
         my_numbers = my_numbers.split()
 
         my_winning_numbers_count = 0
-        current_card_count = 1
+        current_card_count = 1 + (pending.popleft() if pending else 0)
 
         for my_number in my_numbers:
             if my_number in winning_numbers:
                 my_winning_numbers_count += 1
 
-        cards.append([my_winning_numbers_count, current_card_count])
+        for j in range(my_winning_numbers_count):
+            if j < len(pending):
+                pending[j] += current_card_count
+            else:
+                pending.append(current_card_count)
+
+        yield current_card_count
 
-    i = 0
-    while i < len(cards) - 1:
-        m, c = cards[i]
 
-        if m:
-            for j in range(min(len(cards) - 1, m)):
-                cards[i + j + 1][1] += c
+def algo(data: str | Iterable[str]) -> list[int]:
+    return list(get_card_counts(data))
 
-        i += 1
 
-    result = list(map(lambda card: card[1], cards))
-    return result
+def solve(data: str | Iterable[str]) -> int:
+    return sum(get_card_counts(data))
 
 
 def main():
@@ -0,0 +1,57 @@
+import random
+from typing import Iterator
+
+from year_2023.day_5.star_1.algo import END_NAME, START_NAME
+
+NAMES = [
+    START_NAME,
+    "soil",
+    "fertilizer",
+    "water",
+    "light",
+    "temperature",
+    "humidity",
+    END_NAME,
+]
+
+SIZES = [10**3, 10**4, 10**5, 10**6]
+SCALE = 10**9
+
+
+def _get_mapping(rng: random.Random, space: int, count: int) -> list[list[int]]:
+    # sources split the whole space into blocks, destinations are the same blocks in
+    # a shuffled order, so every value is mapped exactly once
+    cuts = sorted(rng.sample(range(1, space), count - 1))
+    blocks = [[start, end - start] for start, end in zip([0] + cuts, cuts + [space])]
+    rng.shuffle(blocks)
+
+    result = []
+    destination = 0
+    for start, length in blocks:
+        result.append([destination, start, length])
+        destination += length
+    return result
+
+
+def generate_lines(
+    size: int, seed: int = 0, ranges: int = 10, mappings: int = 30
+) -> Iterator[str]:
+    """
+    `size` - sum of all seed ranges lengths (what `star_2_01_slow` iterates over),
+    split into `ranges` seed ranges, each map has `mappings` lines.
+    """
+    rng = random.Random(seed)
+    space = max(size * 4, mappings * 2)
+
+    lengths = [size // ranges] * ranges
+    lengths[-1] += size - sum(lengths)
+    seeds = []
+    for length in filter(None, lengths):
+        seeds += [rng.randrange(space - length + 1), length]
+
+    yield "seeds: " + " ".join(map(str, seeds)) + "\n"
+    for source, destination in zip(NAMES, NAMES[1:]):
+        yield "\n"
+        yield f"{source}-to-{destination} map:\n"
+        for line in _get_mapping(rng, space, mappings):
+            yield " ".join(map(str, line)) + "\n"
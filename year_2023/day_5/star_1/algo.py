@@ -193,8 +193,7 @@ def get_seed_location(data: Data, highway: list[str], seed: int) -> int:
     return value
 
 
-def algo(text: str) -> int:
-    data = parse(text)
+def solve(data: Data) -> int:
     highway = get_highway(data.mappings.keys())
 
     locations = [get_seed_location(data, highway, seed) for seed in data.seeds]
@@ -202,6 +201,10 @@ def algo(text: str) -> int:
     return min(locations)
 
 
+def algo(text: str) -> int:
+    return solve(parse(text))
+
+
 def main():
     text = input_data_file.read_text()
     result = algo(text)
@@ -28,8 +28,6 @@ from bisect import bisect_right
 from collections import defaultdict
 from pathlib import Path
 
-from tqdm import tqdm
-
 from year_2023.day_5.star_1.algo import Data, get_highway, parse, START_NAME
 
 CUR_DIR = Path(__file__).parent.resolve()
@@ -69,8 +67,9 @@ def get_seed_location(data: Data, highway: list[str], seed: int) -> int:
     return value
 
 
-def algo(text: str) -> int:
-    data = parse(text)
+def solve(data: Data) -> int:
+    from tqdm import tqdm
+
     highway = get_highway(data.mappings.keys())
 
     locations = []
@@ -94,6 +93,10 @@ def algo(text: str) -> int:
     return min(locations)
 
 
+def algo(text: str) -> int:
+    return solve(parse(text))
+
+
 def main():
     text = input_data_file.read_text()
     result = algo(text)
@@ -31,8 +31,7 @@ from itertools import pairwise
 from pathlib import Path
 from typing import Iterable, Any
 
-from tqdm import tqdm
-
+from commons import span
 from year_2023.day_5.star_1.algo import Data, get_highway, parse, START_NAME
 
 CUR_DIR = Path(__file__).parent.resolve()
@@ -54,6 +53,7 @@ def batched(iterable: Iterable[Any], n: int = 2) -> Iterable[list[Any]]:
         yield b
 
 
+@span("get_next_solutions")
 def get_next_solutions(
     points: list[list[int]], mappings: list[list[int]]
 ) -> list[list[int]]:
@@ -95,9 +95,7 @@ def get_next_solutions(
     return results
 
 
-def algo(text: str) -> int:
-    data = parse(text)
-
+def solve(data: Data) -> int:
     for mappings in data.mappings.values():
         for mapping in mappings:
             mapping[:] = [mapping[0], mapping[0] + mapping[2] - 1, mapping[1]]
@@ -121,6 +119,10 @@ def algo(text: str) -> int:
     return solutions[0][0]
 
 
+def algo(text: str) -> int:
+    return solve(parse(text))
+
+
 def main():
     text = input_data_file.read_text()
     result = algo(text)
@@ -0,0 +1,19 @@
+import random
+from typing import Iterator
+
+SIZES = [10, 100, 1000, 10000]
+SCALE = 10**6
+
+
+def generate_lines(size: int, seed: int = 0, max_time: int = 100) -> Iterator[str]:
+    """
+    `size` - number of races, every record can be beaten. For star 2 the numbers are
+    joined, so big `size` gives a huge single race.
+    """
+    rng = random.Random(seed)
+    times = [rng.randint(7, max_time) for _ in range(size)]
+    # the best distance is (time // 2) * (time - time // 2)
+    distances = [rng.randrange(t // 2 * (t - t // 2)) for t in times]
+
+    yield "Time:     " + " ".join(f"{t:>4}" for t in times) + "\n"
+    yield "Distance: " + " ".join(f"{d:>4}" for d in distances) + "\n"
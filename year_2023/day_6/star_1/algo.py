@@ -118,6 +118,10 @@ def algo(times: list[int], distance: list[int]) -> int:
     return reduce(operator.mul, results)
 
 
+def solve(data: list[list[int]]) -> int:
+    return algo(*data)
+
+
 def main():
     text = input_data_file.read_text()
     result = algo(*parse(text))
@@ -22,7 +22,7 @@ How many ways can you beat the record in this one much longer race?
 """
 from pathlib import Path
 
-from year_2023.day_6.star_1.algo import algo
+from year_2023.day_6.star_1.algo import algo, solve
 
 CUR_DIR = Path(__file__).parent.resolve()
 input_data_file = CUR_DIR / "input.txt"